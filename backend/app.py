@@ -289,7 +289,9 @@ def upload_document():
         
         # Process document to extract content and structure
         logger.info(f"Processing document: {unique_filename}")
-        doc_content = doc_processor.parse_document(filepath)
+        # Only paragraph/table text and locations are used downstream, so skip
+        # run formatting and core properties
+        doc_content = doc_processor.parse_document(filepath, level='text')
         
         if not doc_content:
             logger.error(f"Failed to parse document: {unique_filename}")
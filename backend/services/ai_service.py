@@ -17,12 +17,12 @@ Version: 1.0.0
 """
 
 import os
+import math
 import json
 import re
 import logging
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
-from dateutil import parser as date_parser
 
 # Import Groq client
 try:
@@ -35,6 +35,104 @@ except ImportError:
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Date formats accepted by format_value_for_display, most common first.
+# The validator only ever produces MM/DD/YYYY, so strptime is tried against
+# this short list instead of the (much slower) dateutil heuristic parser.
+DISPLAY_DATE_FORMATS = ('%m/%d/%Y', '%Y-%m-%d', '%B %d, %Y')
+
+# Simple mock responses used when the Groq API is unavailable
+MOCK_RESPONSES = {
+    'greeting': "Welcome! I'll help you fill out this document step by step.",
+    'date': "Please provide the date in MM/DD/YYYY format.",
+    'email': "Please provide a valid email address.",
+    'amount': "Please provide the amount (include currency symbol).",
+    'company': "Please provide the full legal name of the company.",
+    'name': "Please provide the full name.",
+    'default': "Please provide the requested information for this field."
+}
+
+# Mock response types and their keywords, in the order they take precedence
+# when several keywords appear in a prompt
+MOCK_RESPONSE_KEYWORDS = (
+    ('date', ('date',)),
+    ('email', ('email',)),
+    ('amount', ('amount', '$')),
+    ('company', ('company',)),
+    ('name', ('name',))
+)
+
+# Deletion tables for the amount and phone validators (single C-level pass,
+# no regex engine involved)
+AMOUNT_STRIP_TABLE = str.maketrans('', '', ',$')
+PHONE_STRIP_TABLE = str.maketrans('', '', '-()+')
+
+# Complete list of all 50 US states + DC and territories
+US_STATE_ABBREVIATIONS = {
+    'al': 'Alabama',
+    'ak': 'Alaska',
+    'az': 'Arizona',
+    'ar': 'Arkansas',
+    'ca': 'California',
+    'co': 'Colorado',
+    'ct': 'Connecticut',
+    'de': 'Delaware',
+    'fl': 'Florida',
+    'ga': 'Georgia',
+    'hi': 'Hawaii',
+    'id': 'Idaho',
+    'il': 'Illinois',
+    'in': 'Indiana',
+    'ia': 'Iowa',
+    'ks': 'Kansas',
+    'ky': 'Kentucky',
+    'la': 'Louisiana',
+    'me': 'Maine',
+    'md': 'Maryland',
+    'ma': 'Massachusetts',
+    'mi': 'Michigan',
+    'mn': 'Minnesota',
+    'ms': 'Mississippi',
+    'mo': 'Missouri',
+    'mt': 'Montana',
+    'ne': 'Nebraska',
+    'nv': 'Nevada',
+    'nh': 'New Hampshire',
+    'nj': 'New Jersey',
+    'nm': 'New Mexico',
+    'ny': 'New York',
+    'nc': 'North Carolina',
+    'nd': 'North Dakota',
+    'oh': 'Ohio',
+    'ok': 'Oklahoma',
+    'or': 'Oregon',
+    'pa': 'Pennsylvania',
+    'ri': 'Rhode Island',
+    'sc': 'South Carolina',
+    'sd': 'South Dakota',
+    'tn': 'Tennessee',
+    'tx': 'Texas',
+    'ut': 'Utah',
+    'vt': 'Vermont',
+    'va': 'Virginia',
+    'wa': 'Washington',
+    'wv': 'West Virginia',
+    'wi': 'Wisconsin',
+    'wy': 'Wyoming',
+    'dc': 'District of Columbia',
+    # Common territories
+    'pr': 'Puerto Rico',
+    'vi': 'U.S. Virgin Islands',
+    'gu': 'Guam',
+    'as': 'American Samoa',
+    'mp': 'Northern Mariana Islands',
+}
+
+# Lowercased abbreviation or full name -> canonical state name
+STATE_LOOKUP = {
+    **{name.lower(): name for name in US_STATE_ABBREVIATIONS.values()},
+    **US_STATE_ABBREVIATIONS,
+}
+
 
 class AIService:
     """
@@ -47,6 +145,9 @@ class AIService:
     - Maintains conversation history and context
     """
     
+    # Fixed attribute set: no per-instance __dict__, faster attribute reads
+    __slots__ = ('provider', 'client', 'conversation_history', 'system_prompt')
+    
     def __init__(self):
         """
         Initialize the AI service with Groq API or mock fallback.
@@ -649,7 +750,11 @@ Return ONLY the question, no prefixes or extra text."""
             cleaned_value = value.replace(',', '').strip()
             
             try:
-                number = float(cleaned_value)
+                # Whole numbers parse exactly as int; float only for fractional input
+                try:
+                    number = int(cleaned_value)
+                except ValueError:
+                    number = float(cleaned_value)
                 
                 # Ensure it's a positive integer for months/terms
                 if number <= 0:
@@ -707,90 +812,30 @@ Return ONLY the question, no prefixes or extra text."""
         elif placeholder_type == 'address' or ('state' in name) or ('jurisdiction' in name):
             # Special handling for state/jurisdiction fields
             if ('state' in name) or ('jurisdiction' in name):
-                # Complete list of all 50 US states + DC and territories
-                state_map = {
-                    'al': 'Alabama',
-                    'ak': 'Alaska',
-                    'az': 'Arizona',
-                    'ar': 'Arkansas',
-                    'ca': 'California',
-                    'co': 'Colorado',
-                    'ct': 'Connecticut',
-                    'de': 'Delaware',
-                    'fl': 'Florida',
-                    'ga': 'Georgia',
-                    'hi': 'Hawaii',
-                    'id': 'Idaho',
-                    'il': 'Illinois',
-                    'in': 'Indiana',
-                    'ia': 'Iowa',
-                    'ks': 'Kansas',
-                    'ky': 'Kentucky',
-                    'la': 'Louisiana',
-                    'me': 'Maine',
-                    'md': 'Maryland',
-                    'ma': 'Massachusetts',
-                    'mi': 'Michigan',
-                    'mn': 'Minnesota',
-                    'ms': 'Mississippi',
-                    'mo': 'Missouri',
-                    'mt': 'Montana',
-                    'ne': 'Nebraska',
-                    'nv': 'Nevada',
-                    'nh': 'New Hampshire',
-                    'nj': 'New Jersey',
-                    'nm': 'New Mexico',
-                    'ny': 'New York',
-                    'nc': 'North Carolina',
-                    'nd': 'North Dakota',
-                    'oh': 'Ohio',
-                    'ok': 'Oklahoma',
-                    'or': 'Oregon',
-                    'pa': 'Pennsylvania',
-                    'ri': 'Rhode Island',
-                    'sc': 'South Carolina',
-                    'sd': 'South Dakota',
-                    'tn': 'Tennessee',
-                    'tx': 'Texas',
-                    'ut': 'Utah',
-                    'vt': 'Vermont',
-                    'va': 'Virginia',
-                    'wa': 'Washington',
-                    'wv': 'West Virginia',
-                    'wi': 'Wisconsin',
-                    'wy': 'Wyoming',
-                    'dc': 'District of Columbia',
-                    # Common territories
-                    'pr': 'Puerto Rico',
-                    'vi': 'U.S. Virgin Islands',
-                    'gu': 'Guam',
-                    'as': 'American Samoa',
-                    'mp': 'Northern Mariana Islands',
-                }
-                
-                value_lower = value.lower().strip()
+                value_lower = value.lower()
                 
-                # Check if it's a state abbreviation
-                if value_lower in state_map:
-                    value = state_map[value_lower]
+                # Abbreviations and full state names both resolve in one lookup
+                canonical = STATE_LOOKUP.get(value_lower)
+                if canonical:
+                    value = canonical
                 elif len(value) == 2:
                     # Two-letter code not in our map - keep uppercase (might be custom jurisdiction)
                     value = value.upper()
                 else:
-                    # Full name - capitalize properly
+                    # Unknown full name - capitalize properly
                     value = value.title()
                 
                 return {'valid': True, 'processed_value': value}
             else:
                 # Generic address validation
                 # Basic text cleanup
-                value = ' '.join(value.split())  # Normalize whitespace
+                value = self._normalize_whitespace(value)
                 return {'valid': True, 'processed_value': value}
         
         # Amount/currency validation
         elif placeholder_type == 'amount' or any(x in name for x in ['amount', 'price', 'valuation', 'fee', '$']):
             # Remove common formatting characters
-            cleaned_value = re.sub(r'[,$]', '', value)
+            cleaned_value = value.translate(AMOUNT_STRIP_TABLE)
             
             try:
                 # Validate it's a number
@@ -848,8 +893,8 @@ Return ONLY the question, no prefixes or extra text."""
         
         # Phone number validation
         elif 'phone' in name or 'telephone' in name:
-            # Remove common formatting characters
-            cleaned_phone = re.sub(r'[\s\-\(\)\+]', '', value)
+            # Remove all whitespace (including non-breaking spaces), then common formatting characters
+            cleaned_phone = ''.join(value.split()).translate(PHONE_STRIP_TABLE)
             
             # Check if it's a valid length (10-15 digits typically)
             if not cleaned_phone.isdigit() or len(cleaned_phone) < 10 or len(cleaned_phone) > 15:
@@ -870,27 +915,64 @@ Return ONLY the question, no prefixes or extra text."""
             cleaned_value = value.replace(',', '')
             
             try:
-                number = float(cleaned_value)
+                # Whole numbers parse exactly as int (no float rounding on large share counts)
+                number = int(cleaned_value)
                 
                 # Format with commas if it's a large number
-                if number >= 1000 and number == int(number):
-                    value = f"{int(number):,}"
+                if number >= 1000:
+                    value = f"{number:,}"
                 
                 return {'valid': True, 'processed_value': value}
                 
             except ValueError:
+                pass
+            
+            try:
+                number = float(cleaned_value)
+                
+            except ValueError:
+                number = None
+            
+            # "inf", "nan" and exponents beyond float range are not numbers a document can hold
+            if number is None or not math.isfinite(number):
                 return {
                     'valid': False,
                     'error_message': "❌ Please provide a valid number."
                 }
+            
+            # Integral values written with decimals ("5000.00") are formatted like
+            # whole numbers; fractional values are accepted as entered
+            if number >= 1000 and number.is_integer():
+                value = f"{int(number):,}"
+            
+            return {'valid': True, 'processed_value': value}
         
         # Default validation - just ensure it's not empty
         else:
             # Basic text cleanup
-            value = ' '.join(value.split())  # Normalize whitespace
+            value = self._normalize_whitespace(value)
             
             return {'valid': True, 'processed_value': value}
     
+    def _normalize_whitespace(self, value: str) -> str:
+        """
+        Collapse runs of whitespace into single spaces.
+        
+        Most user input is already single-spaced, so the split/join is skipped
+        for printable ASCII text (whose only whitespace is the plain space)
+        without a double space. Anything else - tabs, newlines, NBSP pasted from
+        Word, other Unicode whitespace - goes through split/join.
+        
+        Args:
+            value (str): Text to normalize
+            
+        Returns:
+            str: Text with normalized whitespace
+        """
+        if value.isascii() and value.isprintable() and '  ' not in value:
+            return value.strip()
+        return ' '.join(value.split())
+    
     def _normalize_field_name(self, name: str) -> str:
         """
         Normalize a field name for comparison (handles case, spaces, punctuation).
@@ -951,12 +1033,14 @@ Thank you for using Lexsy Document Assistant!"""
         Returns:
             Dict with 'suggested_name', 'suggested_question', 'field_type'
         """
+        placeholder_get = placeholder.get
+        
         if self.provider == 'groq' and GROQ_AVAILABLE:
             try:
                 # Create a focused prompt for field analysis
-                field_name = placeholder.get('name', 'Unknown Field')
-                field_context = placeholder.get('context', document_context[:200])
-                original_placeholder = placeholder.get('original', '')
+                field_name = placeholder_get('name', 'Unknown Field')
+                field_context = placeholder_get('context', document_context[:200])
+                original_placeholder = placeholder_get('original', '')
                 
                 analysis_prompt = f"""Analyze this placeholder field from a legal document and suggest:
 1. A clear, descriptive field name (max 3-4 words)
@@ -977,7 +1061,8 @@ Respond in this exact JSON format:
 
 Be specific and helpful. If the field name is unclear (like "Field Value" or "_________"), infer from context."""
                 
-                # Get AI analysis
+                # Get AI analysis (not streamed: Groq's JSON mode does not
+                # support streaming)
                 response = self.client.chat.completions.create(
                     model="llama-3.3-70b-versatile",
                     messages=[
@@ -990,29 +1075,29 @@ Be specific and helpful. If the field name is unclear (like "Field Value" or "__
                 )
                 
                 # Parse JSON response
-                import json
                 analysis = json.loads(response.choices[0].message.content)
+                analysis_get = analysis.get
                 
                 return {
-                    'suggested_name': analysis.get('suggested_name', field_name),
-                    'suggested_question': analysis.get('suggested_question', 'Please provide the value for this field.'),
-                    'field_type': analysis.get('field_type', placeholder.get('type', 'text'))
+                    'suggested_name': analysis_get('suggested_name', field_name),
+                    'suggested_question': analysis_get('suggested_question', 'Please provide the value for this field.'),
+                    'field_type': analysis_get('field_type', placeholder_get('type', 'text'))
                 }
                 
             except Exception as e:
                 logger.warning(f"AI field analysis failed: {str(e)}, using fallback")
                 # Fallback to current name
                 return {
-                    'suggested_name': placeholder.get('name', 'Field'),
+                    'suggested_name': placeholder_get('name', 'Field'),
                     'suggested_question': None,
-                    'field_type': placeholder.get('type', 'text')
+                    'field_type': placeholder_get('type', 'text')
                 }
         else:
             # Mock provider - return current name
             return {
-                'suggested_name': placeholder.get('name', 'Field'),
+                'suggested_name': placeholder_get('name', 'Field'),
                 'suggested_question': None,
-                'field_type': placeholder.get('type', 'text')
+                'field_type': placeholder_get('type', 'text')
             }
     
     def get_ai_response(self, prompt: str, context: Optional[str] = None) -> str:
@@ -1063,32 +1148,15 @@ Be specific and helpful. If the field name is unclear (like "Field Value" or "__
         Returns:
             str: Mock response
         """
-        # Simple mock responses for testing
-        responses = {
-            'greeting': "Welcome! I'll help you fill out this document step by step.",
-            'date': "Please provide the date in MM/DD/YYYY format.",
-            'email': "Please provide a valid email address.",
-            'amount': "Please provide the amount (include currency symbol).",
-            'company': "Please provide the full legal name of the company.",
-            'name': "Please provide the full name.",
-            'default': "Please provide the requested information for this field."
-        }
-        
-        # Try to match prompt to response type
+        # Try to match prompt to response type; the first type with a keyword
+        # in the prompt wins
         prompt_lower = prompt.lower()
         
-        if 'date' in prompt_lower:
-            return responses['date']
-        elif 'email' in prompt_lower:
-            return responses['email']
-        elif 'amount' in prompt_lower or '$' in prompt:
-            return responses['amount']
-        elif 'company' in prompt_lower:
-            return responses['company']
-        elif 'name' in prompt_lower:
-            return responses['name']
-        else:
-            return responses['default']
+        for response_type, keywords in MOCK_RESPONSE_KEYWORDS:
+            if any(keyword in prompt_lower for keyword in keywords):
+                return MOCK_RESPONSES[response_type]
+        
+        return MOCK_RESPONSES['default']
     
     def format_value_for_display(self, value: str, placeholder_type: str) -> str:
         """
@@ -1111,10 +1179,12 @@ Be specific and helpful. If the field name is unclear (like "Field Value" or "__
                 value = f"{value}%"
         elif placeholder_type == 'date':
             # Ensure consistent date format
-            try:
-                parsed_date = date_parser.parse(value)
+            for fmt in DISPLAY_DATE_FORMATS:
+                try:
+                    parsed_date = datetime.strptime(value, fmt)
+                except ValueError:
+                    continue
                 value = parsed_date.strftime('%B %d, %Y')  # "January 15, 2024"
-            except:
-                pass
+                break
         
         return value
\ No newline at end of file
@@ -15,21 +15,369 @@ Date: October 2025
 Version: 1.0.0
 """
 
+import io
 import os
 import re
+import posixpath
+import zipfile
 import copy
+import gc
+import mmap
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Dict, List, Any, Iterator, NamedTuple, Optional, Tuple
 from pathlib import Path
 
 from docx import Document
+from docx.oxml.parser import element_class_lookup, parse_xml
+from docx.oxml.simpletypes import ST_Merge
 from docx.shared import RGBColor, Pt, Inches
+from docx.table import _Cell
 from docx.enum.text import WD_COLOR_INDEX
 from docx.enum.style import WD_STYLE_TYPE
+from docx.styles.styles import Styles
+from lxml import etree
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+def _table_grid(tbl) -> List[List[Any]]:
+    """
+    Lay out a table's <w:tc> elements on its column grid in a single pass.
+    
+    Mirrors python-docx's Table._cells (horizontally spanned cells repeat,
+    vertically merged continuation cells resolve to the cell above) without
+    building _Cell objects; python-docx re-walks the whole table on every
+    row.cells access, which is quadratic for large tables.
+    
+    Args:
+        tbl: CT_Tbl element (table._tbl)
+        
+    Returns:
+        List[List]: One list of <w:tc> elements per row, one entry per grid column
+    """
+    col_count = tbl.col_count
+    cells = []
+    for tc in tbl.iter_tcs():
+        for span_idx in range(tc.grid_span):
+            if tc.vMerge == ST_Merge.CONTINUE:
+                cells.append(cells[-col_count])
+            elif span_idx > 0:
+                cells.append(cells[-1])
+            else:
+                cells.append(tc)
+    
+    return [cells[row_idx * col_count:(row_idx + 1) * col_count] for row_idx in range(len(tbl.tr_lst))]
+
+
+@lru_cache(maxsize=256)
+def _compile_alternation(originals: Tuple[str, ...]) -> 're.Pattern':
+    """
+    Compile (once per distinct set of texts) an alternation of literal placeholder texts.
+    
+    Preview refreshes and document generation reuse the same placeholder sets
+    for every paragraph and request, so compiled patterns are cached by the
+    ordered tuple of texts.
+    
+    Args:
+        originals (Tuple[str, ...]): Placeholder texts, longest first
+        
+    Returns:
+        re.Pattern: Compiled alternation
+    """
+    return re.compile('|'.join(re.escape(original) for original in originals))
+
+
+# Static stylesheet embedded at the top of every preview
+PREVIEW_CSS = """
+            <style>
+                .document-preview {
+                    font-family: 'Calibri', 'Arial', sans-serif;
+                    line-height: 1.6;
+                    color: #333;
+                    background: white;
+                    padding: 40px;
+                    max-width: 800px;
+                    margin: 0 auto;
+                }
+                .paragraph {
+                    margin-bottom: 12px;
+                }
+                .heading {
+                    font-weight: bold;
+                    font-size: 1.2em;
+                    margin-top: 20px;
+                    margin-bottom: 10px;
+                }
+                .title {
+                    font-weight: bold;
+                    font-size: 1.5em;
+                    margin-bottom: 20px;
+                    text-align: center;
+                }
+                .placeholder-current {
+                    background-color: #fee2e2;
+                    color: #991b1b;
+                    padding: 4px 8px;
+                    border-radius: 4px;
+                    font-weight: 700;
+                    border: 2px solid #dc2626;
+                    box-shadow: 0 0 8px rgba(220, 38, 38, 0.3);
+                    display: inline-block;
+                }
+                .placeholder-filled {
+                    background-color: #d4edda;
+                    color: #155724;
+                    padding: 2px 6px;
+                    border-radius: 3px;
+                    font-weight: 600;
+                    border: 1px solid #c3e6cb;
+                    cursor: pointer;
+                }
+                .placeholder-filled:hover {
+                    background-color: #c3e6cb;
+                    text-decoration: underline;
+                }
+                .placeholder-unfilled {
+                    background-color: transparent;
+                    color: #333;
+                    padding: 2px 6px;
+                    border-radius: 3px;
+                    font-weight: 500;
+                    border: 1px dashed #ccc;
+                    opacity: 0.6;
+                }
+                .document-table {
+                    width: 100%;
+                    border-collapse: collapse;
+                    margin: 20px 0;
+                }
+                .document-table td, .document-table th {
+                    border: 1px solid #ddd;
+                    padding: 8px;
+                    text-align: left;
+                }
+                .document-table th {
+                    background-color: #f3f4f6;
+                    font-weight: bold;
+                }
+                .document-table tr:nth-child(even) {
+                    background-color: #ffffff;
+                }
+            </style>
+            """
+
+# HTML entity escapes applied in a single str.translate pass
+HTML_ESCAPE_TABLE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#39;'
+})
+
+# WordprocessingML namespace and the Clark-notation ({namespace}local) tags
+# compared against element.tag in the XML walks, spelled out once at import
+WORDML_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+W_BODY, W_P, W_PPR, W_TBL, W_SECTPR, W_TR, W_TC, W_T, W_BR, W_TAB = (
+    f'{{{WORDML_NS}}}{local}' for local in ('body', 'p', 'pPr', 'tbl', 'sectPr', 'tr', 'tc', 't', 'br', 'tab')
+)
+W_BR_TYPE = f'{{{WORDML_NS}}}type'
+W_GRID_COLS = f'{{{WORDML_NS}}}tblGrid/{{{WORDML_NS}}}gridCol'
+XML_SPACE = '{http://www.w3.org/XML/1998/namespace}space'
+
+# Characters written as run elements rather than <w:t> text (as python-docx's
+# run.text setter does): a tab becomes <w:tab/>, a line break <w:br/>
+RUN_BREAK_CHARS_RE = re.compile(r'([\t\n\r])')
+
+# Fixed text of the empty run-content elements (w:br depends on its type)
+RUN_CONTENT_TEXT = {
+    f'{{{WORDML_NS}}}tab': '\t',
+    f'{{{WORDML_NS}}}cr': '\n',
+    f'{{{WORDML_NS}}}noBreakHyphen': '-',
+    f'{{{WORDML_NS}}}ptab': '\t'
+}
+
+# Package relationship types used to locate the main document and its styles
+OFFICE_DOCUMENT_RELTYPE = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument'
+STYLES_RELTYPE = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles'
+PACKAGE_RELS_TAG = '{http://schemas.openxmlformats.org/package/2006/relationships}Relationship'
+
+# Every DOCX is a zip starting with a local file header and carrying a content-types part;
+# legacy .doc (OLE2) and other files are rejected on these before any XML is parsed
+ZIP_MAGIC = b'PK\x03\x04'
+CONTENT_TYPES_PART = '[Content_Types].xml'
+
+# XPath queries run per paragraph/table, compiled once at import
+WORDML_NAMESPACES = {'w': WORDML_NS}
+
+# True when a table contains another table at any depth
+HAS_NESTED_TABLE = etree.XPath('boolean(.//w:tbl)', namespaces=WORDML_NAMESPACES)
+
+# Run content that contributes to Paragraph.text (runs directly in the
+# paragraph or inside hyperlinks), selected by one precompiled query
+PARAGRAPH_TEXT_NODES = etree.XPath(
+    '(w:r | w:hyperlink/w:r)/*[self::w:t or self::w:tab or self::w:br or self::w:cr'
+    ' or self::w:noBreakHyphen or self::w:ptab]',
+    namespaces=WORDML_NAMESPACES
+)
+
+
+def _paragraph_text(p) -> str:
+    """
+    Text of a <w:p> element, identical to python-docx's Paragraph.text.
+    
+    python-docx evaluates (and compiles) one XPath per paragraph plus one per
+    run; this makes a single call to a precompiled query and maps the nodes.
+    
+    Args:
+        p: <w:p> element
+        
+    Returns:
+        str: Paragraph text with tabs and line breaks as characters
+    """
+    parts = []
+    for node in PARAGRAPH_TEXT_NODES(p):
+        tag = node.tag
+        if tag == W_T:
+            parts.append(node.text or '')
+        elif tag == W_BR:
+            if node.get(W_BR_TYPE, 'textWrapping') == 'textWrapping':
+                parts.append('\n')
+        else:
+            parts.append(RUN_CONTENT_TEXT[tag])
+    return ''.join(parts)
+
+
+def _run_content_text(node) -> str:
+    """
+    Text one run-content node (from PARAGRAPH_TEXT_NODES) adds to Paragraph.text.
+    
+    Args:
+        node: <w:t>, <w:tab>, <w:br>, <w:cr>, <w:noBreakHyphen> or <w:ptab> element
+        
+    Returns:
+        str: The node's text; empty for page and column breaks
+    """
+    tag = node.tag
+    if tag == W_T:
+        return node.text or ''
+    if tag == W_BR:
+        return '\n' if node.get(W_BR_TYPE, 'textWrapping') == 'textWrapping' else ''
+    return RUN_CONTENT_TEXT[tag]
+
+
+def _table_cell_texts(rows) -> Iterator[str]:
+    """
+    Stripped text of each non-empty cell of a table, row by row.
+    
+    Each physical <w:tc> is read once: merged cells are not repeated for
+    every grid column/row they cover.
+    
+    Args:
+        rows: The table's <w:tr> elements
+        
+    Yields:
+        str: Cell text, paragraphs joined by newlines
+    """
+    for tr in rows:
+        for tc in tr.iterchildren(W_TC):
+            # Single-paragraph cells (the common case) skip the join
+            cell_paras = tc.findall(W_P)
+            cell_text = _paragraph_text(cell_paras[0]) if len(cell_paras) == 1 \
+                else '\n'.join([_paragraph_text(p) for p in cell_paras])
+            if cell_text and not cell_text.isspace():
+                yield cell_text.strip()
+
+
+def _collapse_whitespace(text: str) -> str:
+    """
+    Collapse every run of whitespace (tabs, line breaks, non-breaking spaces...)
+    into one space and strip the ends.
+    
+    str.split() without arguments already splits on all Unicode whitespace in
+    C, so no translate table or regex is needed.
+    
+    Args:
+        text (str): Text to normalize
+        
+    Returns:
+        str: Single-line text
+    """
+    return ' '.join(text.split())
+
+
+# {{placeholder}} style pattern
+PLACEHOLDER_PATTERN = re.compile(r'\{\{([^}]+)\}\}')
+
+# Preview span templates, filled with str.format_map
+CURRENT_SPAN_TEMPLATE = '''<span class="placeholder-current" 
+                                       title="Field: {name} - Currently filling this field"
+                                       data-ph="{id}"
+                                       data-key="{key}"
+                                       data-index="{index}">
+                                       [{name}]</span>'''
+
+FILLED_SPAN_TEMPLATE = '''<span class="placeholder-filled" 
+                                       title="Field: {name} - Click to edit (Value: {value})"
+                                       data-ph="{id}"
+                                       data-key="{key}"
+                                       data-index="{index}">
+                                       {value}</span>'''
+
+UNFILLED_SPAN_TEMPLATE = '''<span class="placeholder-unfilled" 
+                                       title="Field: {name} - Not yet filled"
+                                       data-ph="{id}"
+                                       data-key="{key}"
+                                       data-index="{index}">
+                                       {original}</span>'''
+
+
+class DocText(NamedTuple):
+    """Extracted document text, kept as separate paragraph and table cell columns."""
+    paragraphs: Tuple[str, ...]
+    cells: Tuple[str, ...]
+    
+    @property
+    def text(self) -> str:
+        """Plain text: non-empty paragraphs, then non-empty table cells, one per line."""
+        return '\n'.join(self.paragraphs + self.cells)
+
+
+EMPTY_DOC_TEXT = DocText((), ())
+
+
+@dataclass
+class ValidationResult:
+    """
+    Outcome of a document validation: fixed attributes instead of a dict.
+    
+    Supports read-only mapping access (result['valid'], dict(result)) for
+    callers written against the original dict.
+    """
+    __slots__ = ('valid', 'issues', 'warnings', 'stats')
+    
+    valid: bool
+    issues: List[str]
+    warnings: List[str]
+    stats: Dict[str, Any]
+    
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def keys(self) -> Tuple[str, ...]:
+        return self.__slots__
+    
+    def copy(self) -> 'ValidationResult':
+        """Return a copy whose lists and stats can be mutated independently."""
+        return ValidationResult(self.valid, list(self.issues), list(self.warnings), dict(self.stats))
+
 
 class DocumentProcessor:
     """
@@ -46,11 +394,22 @@ class DocumentProcessor:
         """
         Initialize the DocumentProcessor with default settings.
         """
-        self.placeholder_pattern = re.compile(r'\{\{([^}]+)\}\}')
         self.supported_formats = ['.docx', '.doc']
+        
+        # Parsed content keyed by (filepath, mtime_ns, size) so unchanged
+        # files are never re-parsed; a changed file gets a new key
+        self._parse_cached = lru_cache(maxsize=32)(self._parse_docx)
+        
+        # Rendered preview paragraphs keyed by (text, style, placeholder states),
+        # so a refresh only re-renders paragraphs whose placeholders changed
+        self._render_paragraph_cached = lru_cache(maxsize=4096)(self._render_paragraph)
+        
+        # Validation/text results keyed by (filepath, mtime_ns, size, with_text),
+        # so repeated checks of an unchanged file skip the zip and XML work
+        self._analyze_cached = lru_cache(maxsize=64)(self._analyze_file)
         logger.info("DocumentProcessor initialized")
     
-    def parse_document(self, filepath: str) -> Dict[str, Any]:
+    def parse_document(self, filepath: str, level: str = 'full') -> Dict[str, Any]:
         """
         Parse a DOCX document and extract its content structure.
         
@@ -60,8 +419,13 @@ class DocumentProcessor:
         - Document metadata
         - Raw text for analysis
         
+        Results are cached per (filepath, mtime, size, level). Each call returns
+        a deep copy of the cached structure, so callers are free to mutate it.
+        
         Args:
             filepath (str): Path to the DOCX file to parse
+            level (str): 'full' for run formatting and core properties, 'text' for
+                paragraph text, style and location only (runs are left empty)
             
         Returns:
             Dict[str, Any]: Document content structure with paragraphs, tables, and metadata
@@ -71,103 +435,376 @@ class DocumentProcessor:
             Exception: For document parsing errors
         """
         try:
+            if level not in ('full', 'text'):
+                raise ValueError(f"Unknown parse level: {level}")
+            
             # Validate file exists
             if not os.path.exists(filepath):
                 logger.error(f"Document file not found: {filepath}")
                 raise FileNotFoundError(f"Document not found: {filepath}")
             
-            # Open and parse the document
-            doc = Document(filepath)
-            logger.info(f"Opened document: {filepath}")
-            
-            # Initialize content structure
-            content = {
-                'paragraphs': [],
-                'tables': [],
-                'raw_text': '',
-                'metadata': {
-                    'sections': len(doc.sections),
-                    'paragraphs_count': len(doc.paragraphs),
-                    'tables_count': len(doc.tables),
-                    'core_properties': self._extract_core_properties(doc)
-                }
+            # Legacy .doc and other non-zip files fail here instead of deep inside the parser
+            if not self._is_docx(filepath):
+                raise ValueError("File is not a DOCX document")
+            
+            stat = os.stat(filepath)
+            content = self._parse_cached(filepath, stat.st_mtime_ns, stat.st_size, level)
+            return copy.deepcopy(content)
+            
+        except FileNotFoundError:
+            raise
+        except Exception as e:
+            logger.error(f"Error parsing document {filepath}: {str(e)}")
+            raise Exception(f"Document parsing failed: {str(e)}")
+    
+    def _parse_docx(self, filepath: str, mtime_ns: int, size: int, level: str = 'full') -> Dict[str, Any]:
+        """
+        Parse a DOCX file into the content structure returned by parse_document.
+        
+        mtime_ns and size are only part of the cache key; the returned dict is
+        shared by every cache hit and must be treated as read-only.
+        
+        Args:
+            filepath (str): Path to the DOCX file to parse
+            mtime_ns (int): File modification time in nanoseconds
+            size (int): File size in bytes
+            level (str): 'full' or 'text', see parse_document
+            
+        Returns:
+            Dict[str, Any]: Document content structure
+        """
+        # Text level never needs the python-docx object model
+        if level == 'text':
+            return self._parse_docx_text(filepath)
+        
+        # Open and parse the document
+        doc = Document(filepath)
+        logger.info(f"Opened document: {filepath}")
+        full = level == 'full'
+        
+        # Initialize content structure
+        content = {
+            'paragraphs': [],
+            'tables': [],
+            'raw_text': '',
+            'metadata': {
+                'sections': len(doc.sections),
+                'paragraphs_count': len(doc.paragraphs),
+                'tables_count': len(doc.tables),
+                'core_properties': self._extract_core_properties(doc) if full else {}
+            }
+        }
+        
+        # Extract paragraphs with formatting
+        full_text = []
+        
+        # Loop-invariant lookups bound to locals
+        get_color = self._get_color_value
+        append_para = content['paragraphs'].append
+        
+        for i, paragraph in enumerate(doc.paragraphs):
+            para_text = paragraph.text.strip()
+        
+            # Skip empty paragraphs
+            if not para_text:
+                continue
+        
+            # Extract paragraph data
+            para_data = {
+                'index': i,
+                'text': para_text,
+                'style': paragraph.style.name if paragraph.style else 'Normal',
+                'runs': []
             }
             
-            # Extract paragraphs with formatting
-            full_text = []
-            for i, paragraph in enumerate(doc.paragraphs):
-                para_text = paragraph.text.strip()
-                
-                # Skip empty paragraphs
-                if not para_text:
-                    continue
-                
-                # Extract paragraph data
-                para_data = {
-                    'index': i,
-                    'text': para_text,
-                    'style': paragraph.style.name if paragraph.style else 'Normal',
-                    'alignment': str(paragraph.alignment) if paragraph.alignment else 'LEFT',
-                    'runs': []
+            # Text level stops here: no alignment or run formatting
+            if full:
+                para_data['alignment'] = str(paragraph.alignment) if paragraph.alignment else 'LEFT'
+            
+            # Extract run-level formatting for precise reconstruction
+            for run in (paragraph.runs if full else ()):
+                # Each font property walks the run's XML, so read each one once
+                font = run.font
+                font_size = font.size
+                font_color = font.color
+                run_data = {
+                    'text': run.text,
+                    'bold': run.bold or False,
+                    'italic': run.italic or False,
+                    'underline': run.underline or False,
+                    'font_size': font_size.pt if font_size else 12,
+                    'font_name': font.name or 'Calibri',
+                    'font_color': get_color(font_color) if font_color else None
                 }
+                para_data['runs'].append(run_data)
+        
+            append_para(para_data)
+            full_text.append(para_text)
+        
+        # Extract tables with structure preservation
+        for table_idx, table in enumerate(doc.tables):
+            tbl = table._tbl
+            table_data = {
+                'index': table_idx,
+                'rows': [],
+                'dimensions': (len(tbl.tr_lst), tbl.col_count if tbl.tr_lst else 0),
+                'style': table.style.name if table.style else None
+            }
+        
+            # Extract each cell's content straight from the <w:tc> elements
+            for row_idx, row_tcs in enumerate(_table_grid(tbl)):
+                row_data = []
+                for cell_idx, tc in enumerate(row_tcs):
+                    cell_paragraphs = [p.text for p in tc.p_lst]
+                    cell_text = '\n'.join(cell_paragraphs).strip()
+                    cell_data = {
+                        'text': cell_text,
+                        'row': row_idx,
+                        'col': cell_idx,
+                        'paragraphs': cell_paragraphs
+                    }
+                    row_data.append(cell_data)
+                
+                    # Add cell text to full text for searching
+                    if cell_text:
+                        full_text.append(cell_text)
+            
+                table_data['rows'].append(row_data)
+        
+            content['tables'].append(table_data)
+        
+        # Combine all text for analysis
+        content['raw_text'] = '\n'.join(full_text)
+        
+        logger.info(f"Successfully parsed document with {len(content['paragraphs'])} paragraphs and {len(content['tables'])} tables")
+        return content
+    
+    def _parse_docx_text(self, filepath: str) -> Dict[str, Any]:
+        """
+        Build the text-level content structure by streaming the document XML.
+        
+        word/document.xml is read with iterparse straight from the zip, using
+        python-docx's element classes so paragraph text, table grids and style
+        lookups behave exactly as in the Document-based parse. Body-level
+        elements are freed as soon as they have been read.
+        
+        Args:
+            filepath (str): Path to the DOCX file to parse
+            
+        Returns:
+            Dict[str, Any]: Document content structure (level 'text')
+        """
+        content = {
+            'paragraphs': [],
+            'tables': [],
+            'raw_text': '',
+            'metadata': {
+                'sections': 0,
+                'paragraphs_count': 0,
+                'tables_count': 0,
+                'core_properties': {}
+            }
+        }
+        metadata = content['metadata']
+        full_text = []
+        # Cell text follows all paragraph text in raw_text, as in the full parse
+        table_text = []
+        
+        with self._open_package(filepath) as package:
+            document_part, styles_part = self._locate_docx_parts(package)
+            styles = Styles(parse_xml(package.read(styles_part))) if styles_part else None
+            
+            # Style id -> display name, resolved the way Paragraph.style / Table.style do
+            style_names = {}
+            
+            def style_name(style_id, style_type, fallback):
+                key = (style_id, style_type)
+                if key not in style_names:
+                    style = styles.get_by_id(style_id, style_type) if styles is not None else None
+                    style_names[key] = style.name if style is not None else fallback
+                return style_names[key]
+            
+            for element in self._iter_body_blocks(package, document_part):
+                if element.tag == W_P:
+                    i = metadata['paragraphs_count']
+                    metadata['paragraphs_count'] += 1
+                    para_text = _paragraph_text(element).strip()
+                    if para_text:
+                        para_style = style_name(element.style, WD_STYLE_TYPE.PARAGRAPH, 'Normal')
+                        content['paragraphs'].append({
+                            'index': i,
+                            'text': para_text,
+                            'style': para_style,
+                            'runs': []
+                        })
+                        full_text.append(para_text)
                 
-                # Extract run-level formatting for precise reconstruction
-                for run in paragraph.runs:
-                    run_data = {
-                        'text': run.text,
-                        'bold': run.bold if run.bold is not None else False,
-                        'italic': run.italic if run.italic is not None else False,
-                        'underline': run.underline if run.underline else False,
-                        'font_size': run.font.size.pt if run.font.size else 12,
-                        'font_name': run.font.name if run.font.name else 'Calibri',
-                        'font_color': self._get_color_value(run.font.color) if run.font.color else None
+                elif element.tag == W_TBL:
+                    table_idx = metadata['tables_count']
+                    metadata['tables_count'] += 1
+                    table_data = {
+                        'index': table_idx,
+                        'rows': [],
+                        'dimensions': (len(element.tr_lst), element.col_count if element.tr_lst else 0),
+                        'style': style_name(element.tblStyle_val, WD_STYLE_TYPE.TABLE, None)
                     }
-                    para_data['runs'].append(run_data)
+                    for row_idx, row_tcs in enumerate(_table_grid(element)):
+                        row_data = []
+                        for cell_idx, tc in enumerate(row_tcs):
+                            cell_paragraphs = [_paragraph_text(p) for p in tc.p_lst]
+                            cell_text = '\n'.join(cell_paragraphs).strip()
+                            row_data.append({
+                                'text': cell_text,
+                                'row': row_idx,
+                                'col': cell_idx,
+                                'paragraphs': cell_paragraphs
+                            })
+                            if cell_text:
+                                table_text.append(cell_text)
+                        table_data['rows'].append(row_data)
+                    content['tables'].append(table_data)
                 
-                content['paragraphs'].append(para_data)
-                full_text.append(para_text)
-            
-            # Extract tables with structure preservation
-            for table_idx, table in enumerate(doc.tables):
-                table_data = {
-                    'index': table_idx,
-                    'rows': [],
-                    'dimensions': (len(table.rows), len(table.columns) if table.rows else 0),
-                    'style': table.style.name if table.style else None
-                }
+                else:
+                    metadata['sections'] += 1
+        
+        content['raw_text'] = '\n'.join(full_text + table_text)
+        
+        logger.info(f"Successfully parsed document text with {len(content['paragraphs'])} paragraphs and {len(content['tables'])} tables")
+        return content
+    
+    @contextmanager
+    def _open_package(self, filepath: str) -> Iterator[zipfile.ZipFile]:
+        """
+        Open a DOCX package for reading through a read-only memory map.
+        
+        Zip members are read straight from the mapped pages instead of going
+        through an extra buffered-IO copy.
+        
+        Args:
+            filepath (str): Path to the DOCX file
+            
+        Yields:
+            zipfile.ZipFile: Open package
+        """
+        with open(filepath, 'rb') as f, _MappedFile(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            # Members are mostly read front to back: let the kernel read ahead
+            if hasattr(mapped, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            with zipfile.ZipFile(mapped) as package:
+                # Raises KeyError for zips that are not OPC packages
+                package.getinfo(CONTENT_TYPES_PART)
+                yield package
+    
+    def _is_docx(self, filepath: str) -> bool:
+        """
+        Check a file's zip signature without opening it as a package.
+        
+        Args:
+            filepath (str): Path to the file
+            
+        Returns:
+            bool: True if the file starts with the zip local file header
+        """
+        with open(filepath, 'rb') as f:
+            return f.read(len(ZIP_MAGIC)) == ZIP_MAGIC
+    
+    def _iter_body_blocks(self, package: zipfile.ZipFile, document_part: str,
+                          element_classes: bool = True) -> Iterator[Any]:
+        """
+        Stream the body-level blocks of a document part in document order.
+        
+        Yields every body <w:p> and <w:tbl> once it has been fully read, plus each
+        <w:sectPr> that ends a section (the body's own and those carried by body
+        paragraphs, which are yielded before their paragraph). A block is only
+        valid until the next one is requested: it is then cleared and removed to
+        keep memory flat.
+        
+        Args:
+            package (zipfile.ZipFile): Open DOCX package
+            document_part (str): Zip member name of the main document part
+            element_classes (bool): Build python-docx element classes (CT_P, CT_Tbl...)
+                instead of plain lxml elements
+            
+        Yields:
+            Body-level w:p, w:tbl and w:sectPr elements
+        """
+        with package.open(document_part) as document_xml:
+            events = etree.iterparse(document_xml, events=('end',), tag=(W_P, W_TBL, W_SECTPR),
+                                     remove_blank_text=True, resolve_entities=False)
+            if element_classes:
+                events.set_element_class_lookup(element_class_lookup)
+            
+            for _, element in events:
+                parent = element.getparent()
                 
-                # Extract each cell's content
-                for row_idx, row in enumerate(table.rows):
-                    row_data = []
-                    for cell_idx, cell in enumerate(row.cells):
-                        cell_text = cell.text.strip()
-                        cell_data = {
-                            'text': cell_text,
-                            'row': row_idx,
-                            'col': cell_idx,
-                            'paragraphs': [p.text for p in cell.paragraphs]
-                        }
-                        row_data.append(cell_data)
-                        
-                        # Add cell text to full text for searching
-                        if cell_text:
-                            full_text.append(cell_text)
-                    
-                    table_data['rows'].append(row_data)
+                # Paragraphs and tables nested in tables are read with their table;
+                # section breaks carried by body paragraphs still count as sections
+                if parent is None or parent.tag != W_BODY:
+                    if element.tag == W_SECTPR and parent is not None and parent.tag == W_PPR \
+                            and parent.getparent().getparent().tag == W_BODY:
+                        yield element
+                    continue
                 
-                content['tables'].append(table_data)
+                yield element
+                
+                # Everything before this element has been read; drop it
+                element.clear(keep_tail=True)
+                while element.getprevious() is not None:
+                    del parent[0]
+    
+    def _iter_docx_body(self, filepath: str) -> Iterator[Any]:
+        """
+        Open a DOCX file and stream its body-level blocks as plain lxml elements.
+        
+        The single body walk behind both validation (_analyze_file) and iter_text;
+        the same block lifetime rules as _iter_body_blocks apply.
+        
+        Args:
+            filepath (str): Path to the document
             
-            # Combine all text for analysis
-            content['raw_text'] = '\n'.join(full_text)
+        Yields:
+            Body-level w:p, w:tbl and w:sectPr elements
             
-            logger.info(f"Successfully parsed document with {len(content['paragraphs'])} paragraphs and {len(content['tables'])} tables")
-            return content
+        Raises:
+            ValueError: If the file does not start with the zip signature
+        """
+        # Files without a zip signature (legacy .doc, renamed files) are rejected
+        # before the package is opened
+        if not self._is_docx(filepath):
+            raise ValueError('not a DOCX file')
+        
+        with self._open_package(filepath) as package:
+            document_part, _ = self._locate_docx_parts(package)
+            yield from self._iter_body_blocks(package, document_part, element_classes=False)
+    
+    def _locate_docx_parts(self, package: zipfile.ZipFile) -> Tuple[str, Optional[str]]:
+        """
+        Find the main document part and its styles part inside a DOCX zip.
+        
+        Args:
+            package (zipfile.ZipFile): Open DOCX package
             
-        except FileNotFoundError:
-            raise
-        except Exception as e:
-            logger.error(f"Error parsing document {filepath}: {str(e)}")
-            raise Exception(f"Document parsing failed: {str(e)}")
+        Returns:
+            Tuple[str, Optional[str]]: Zip member names of document.xml and styles.xml
+                (styles is None when the document has no styles part)
+        """
+        def targets(rels_name, base_dir, reltype):
+            try:
+                rels = etree.fromstring(package.read(rels_name))
+            except KeyError:
+                return []
+            return [
+                posixpath.normpath(posixpath.join(base_dir, rel.get('Target'))).lstrip('/')
+                for rel in rels.iter(PACKAGE_RELS_TAG)
+                if rel.get('Type') == reltype and rel.get('TargetMode') != 'External'
+            ]
+        
+        documents = targets('_rels/.rels', '', OFFICE_DOCUMENT_RELTYPE)
+        document_part = documents[0] if documents else 'word/document.xml'
+        
+        base_dir, name = posixpath.split(document_part)
+        styles = targets(posixpath.join(base_dir, '_rels', name + '.rels'), base_dir, STYLES_RELTYPE)
+        return document_part, styles[0] if styles else None
     
     def _extract_core_properties(self, doc: Document) -> Dict[str, Any]:
         """
@@ -230,204 +867,73 @@ class DocumentProcessor:
             str: HTML string representing the document preview
         """
         try:
-            preview_html = ['<div class="document-preview">']
+            buffer = io.StringIO()
+            write = buffer.write
+            
+            # Fragments are newline-separated; each later write is prefixed with '\n'
+            write('<div class="document-preview">')
             
             # Add custom CSS for preview styling
-            preview_html.append("""
-            <style>
-                .document-preview {
-                    font-family: 'Calibri', 'Arial', sans-serif;
-                    line-height: 1.6;
-                    color: #333;
-                    background: white;
-                    padding: 40px;
-                    max-width: 800px;
-                    margin: 0 auto;
-                }
-                .paragraph {
-                    margin-bottom: 12px;
-                }
-                .heading {
-                    font-weight: bold;
-                    font-size: 1.2em;
-                    margin-top: 20px;
-                    margin-bottom: 10px;
-                }
-                .title {
-                    font-weight: bold;
-                    font-size: 1.5em;
-                    margin-bottom: 20px;
-                    text-align: center;
-                }
-                .placeholder-current {
-                    background-color: #fee2e2;
-                    color: #991b1b;
-                    padding: 4px 8px;
-                    border-radius: 4px;
-                    font-weight: 700;
-                    border: 2px solid #dc2626;
-                    box-shadow: 0 0 8px rgba(220, 38, 38, 0.3);
-                    display: inline-block;
-                }
-                .placeholder-filled {
-                    background-color: #d4edda;
-                    color: #155724;
-                    padding: 2px 6px;
-                    border-radius: 3px;
-                    font-weight: 600;
-                    border: 1px solid #c3e6cb;
-                    cursor: pointer;
-                }
-                .placeholder-filled:hover {
-                    background-color: #c3e6cb;
-                    text-decoration: underline;
-                }
-                .placeholder-unfilled {
-                    background-color: transparent;
-                    color: #333;
-                    padding: 2px 6px;
-                    border-radius: 3px;
-                    font-weight: 500;
-                    border: 1px dashed #ccc;
-                    opacity: 0.6;
-                }
-                .document-table {
-                    width: 100%;
-                    border-collapse: collapse;
-                    margin: 20px 0;
-                }
-                .document-table td, .document-table th {
-                    border: 1px solid #ddd;
-                    padding: 8px;
-                    text-align: left;
-                }
-                .document-table th {
-                    background-color: #f3f4f6;
-                    font-weight: bold;
-                }
-                .document-table tr:nth-child(even) {
-                    background-color: #ffffff;
-                }
-            </style>
-            """)
+            write('\n')
+            write(PREVIEW_CSS)
+            
+            # Index placeholders by location once instead of filtering per paragraph
+            by_para, by_table = self._index_placeholders(placeholders)
+            
+            # Loop-invariant lookups bound to locals
+            render_paragraph = self._render_paragraph_cached
+            span_state = self._preview_span_state
+            placeholders_at = by_para.get
             
             # Process paragraphs
             for para in content.get('paragraphs', []):
                 para_text = para['text']
                 para_location = para['index']  # Get paragraph location
                 
-                # CRITICAL FIX: Filter placeholders that belong to THIS specific paragraph
+                # CRITICAL FIX: Only placeholders that belong to THIS specific paragraph
                 # This prevents replacing placeholders from other locations
-                para_placeholders = [
-                    (idx, p) for idx, p in enumerate(placeholders)
-                    if p.get('location_type') == 'paragraph' and p.get('location') == para_location
-                ]
-                
-                # Track what we've replaced to avoid double-replacement within same paragraph
-                replaced_in_this_para = set()
-                
-                # Replace placeholders with highlighted versions (only for THIS paragraph)
-                for idx, placeholder in para_placeholders:
-                    placeholder_key = placeholder['key']
-                    placeholder_text = placeholder['original']
-                    placeholder_name = placeholder.get('name', 'Field')
-                    placeholder_id = placeholder.get('id', placeholder_key)  # Get ID early
-                    
-                    # Check if this placeholder pattern exists in this paragraph
-                    if placeholder_text not in para_text:
-                        continue
-                    
-                    # Check if we already replaced this pattern in this paragraph
-                    # (handles edge case where same pattern appears multiple times in one paragraph)
-                    if placeholder_text in replaced_in_this_para:
-                        continue
-                    
-                    is_current = (current_index is not None and idx == current_index)
-                    # Check filled status by ID first, then key as fallback
-                    is_filled = placeholder_id in filled_values or placeholder_key in filled_values
-                    
-                    # Determine CSS class and styling
-                    if is_current:
-                        # Current field - highlight in RED with field name
-                        field_name_display = f"[{placeholder_name}]"
-                        replacement = f'''<span class="placeholder-current" 
-                                       title="Field: {placeholder_name} - Currently filling this field"
-                                       data-ph="{placeholder_id}"
-                                       data-key="{placeholder_key}"
-                                       data-index="{idx}">
-                                       {field_name_display}</span>'''
-                    elif is_filled:
-                        # Filled field - show in GREEN with value and field name
-                        # Look up by ID first, then key as fallback
-                        field_value = filled_values.get(placeholder_id, filled_values.get(placeholder_key, ''))
-                        replacement = f'''<span class="placeholder-filled" 
-                                       title="Field: {placeholder_name} - Click to edit (Value: {field_value})"
-                                       data-ph="{placeholder_id}"
-                                       data-key="{placeholder_key}"
-                                       data-index="{idx}">
-                                       {field_value}</span>'''
-                    else:
-                        # Unfilled field - show minimally (no highlight until it's current)
-                        replacement = f'''<span class="placeholder-unfilled" 
-                                       title="Field: {placeholder_name} - Not yet filled"
-                                       data-ph="{placeholder_id}"
-                                       data-key="{placeholder_key}"
-                                       data-index="{idx}">
-                                       {placeholder_text}</span>'''
-                    
-                    # Replace only the FIRST occurrence
-                    para_text = para_text.replace(placeholder_text, replacement, 1)
-                    replaced_in_this_para.add(placeholder_text)
+                para_placeholders = placeholders_at(para_location)
                 
-                # Apply paragraph styling based on style name
-                style_class = 'paragraph'
-                if 'heading' in para['style'].lower():
-                    style_class = 'heading'
-                elif 'title' in para['style'].lower():
-                    style_class = 'title'
+                # Everything the rendered paragraph depends on; unchanged paragraphs
+                # come straight from the cache
+                states = tuple(
+                    span_state(idx, placeholder, filled_values, current_index)
+                    for idx, placeholder in para_placeholders
+                ) if para_placeholders else ()
                 
-                # Escape any remaining HTML entities
-                para_text = self._escape_html(para_text, preserve_spans=True)
-                
-                preview_html.append(f'<p class="{style_class}">{para_text}</p>')
+                write('\n')
+                write(render_paragraph(para_text, para['style'], states))
             
             # Process tables
             for table in content.get('tables', []):
-                preview_html.append('<table class="document-table">')
+                write('\n<table class="document-table">')
                 
                 for row_idx, row in enumerate(table['rows']):
-                    preview_html.append('<tr>')
+                    write('\n<tr>')
                     
-                    for cell in row:
+                    for col_idx, cell in enumerate(row):
                         cell_text = cell['text'] if isinstance(cell, dict) else cell
                         
-                        # Apply placeholder highlighting in table cells
-                        for placeholder in placeholders:
-                            placeholder_id = placeholder.get('id', placeholder['key'])
-                            # Check by ID first, then key as fallback
-                            if placeholder_id in filled_values or placeholder['key'] in filled_values:
-                                value = filled_values.get(placeholder_id, filled_values.get(placeholder['key'], ''))
-                                cell_text = cell_text.replace(
-                                    placeholder['original'],
-                                    f'<span class="placeholder-filled">{value}</span>'
-                                )
-                            else:
-                                cell_text = cell_text.replace(
-                                    placeholder['original'],
-                                    f'<span class="placeholder-unfilled">{placeholder["original"]}</span>'
-                                )
+                        # Apply placeholder highlighting using only THIS cell's placeholders
+                        cell_placeholders = by_table.get(f"{table['index']}-{row_idx}-{col_idx}")
+                        if cell_placeholders:
+                            cell_text, _ = self._substitute_placeholders(
+                                cell_text,
+                                self._group_by_original(cell_placeholders),
+                                lambda entry: self._render_cell_span(entry[1], filled_values)
+                            )
                         
                         # Use th for first row (header)
                         tag = 'th' if row_idx == 0 else 'td'
-                        preview_html.append(f'<{tag}>{cell_text}</{tag}>')
+                        write(f'\n<{tag}>{cell_text}</{tag}>')
                     
-                    preview_html.append('</tr>')
+                    write('\n</tr>')
                 
-                preview_html.append('</table>')
+                write('\n</table>')
             
-            preview_html.append('</div>')
+            write('\n</div>')
             
-            return '\n'.join(preview_html)
+            return buffer.getvalue()
             
         except Exception as e:
             logger.error(f"Error generating preview: {str(e)}")
@@ -446,14 +952,345 @@ class DocumentProcessor:
             str: Escaped text
         """
         if not preserve_spans:
-            text = text.replace('&', '&amp;')
-            text = text.replace('<', '&lt;')
-            text = text.replace('>', '&gt;')
-            text = text.replace('"', '&quot;')
-            text = text.replace("'", '&#39;')
+            text = text.translate(HTML_ESCAPE_TABLE)
         
         return text
     
+    def _build_placeholder_pattern(self, originals) -> 're.Pattern':
+        """
+        Compile a single alternation matching any of the given placeholder texts.
+        
+        Longer texts are tried first so overlapping patterns (e.g. "$[___]" and
+        "[___]") always match in full.
+        
+        Args:
+            originals: Iterable of literal placeholder texts
+            
+        Returns:
+            re.Pattern: Compiled alternation
+        """
+        return _compile_alternation(tuple(sorted(originals, key=lambda original: (-len(original), original))))
+    
+    def _index_placeholders(self, placeholders: List[Dict]) -> Tuple[Dict[Any, List], Dict[str, List]]:
+        """
+        Index placeholders by the paragraph or table cell they belong to.
+        
+        Args:
+            placeholders (List[Dict]): List of detected placeholders
+            
+        Returns:
+            Tuple of (paragraph index -> entries, "table-row-col" -> entries),
+            where each entry is an (index in placeholders, placeholder) tuple
+        """
+        by_para = {}
+        by_table = {}
+        for idx, placeholder in enumerate(placeholders):
+            location_type = placeholder.get('location_type')
+            if location_type == 'paragraph':
+                by_para.setdefault(placeholder.get('location'), []).append((idx, placeholder))
+            elif location_type == 'table':
+                by_table.setdefault(str(placeholder.get('location')), []).append((idx, placeholder))
+        return by_para, by_table
+    
+    def _group_by_original(self, entries: List[Tuple[int, Dict]]) -> Dict[str, List[Tuple[int, Dict]]]:
+        """
+        Group placeholder entries by their original text, keeping document order.
+        
+        Args:
+            entries (List): (index, placeholder) tuples
+            
+        Returns:
+            Dict[str, List]: Original text -> entries sharing that text
+        """
+        grouped = {}
+        for entry in entries:
+            grouped.setdefault(entry[1]['original'], []).append(entry)
+        return grouped
+    
+    def _substitute_placeholders(self, text: str, grouped: Dict[str, List[Any]],
+                                 render, pending: Optional[Dict[str, Any]] = None,
+                                 spans: Optional[List[Tuple[int, int, str]]] = None) -> Tuple[str, int]:
+        """
+        Replace placeholder occurrences in text with a single regex pass.
+        
+        The n-th occurrence of an original text is handed to the n-th entry that
+        shares it; occurrences without an entry are left untouched. When render
+        returns None the occurrence is also left untouched.
+        
+        Args:
+            text (str): Text to scan
+            grouped (Dict): Original text -> entries, as built by _group_by_original
+            render: Callable mapping an entry to its replacement string (or None)
+            pending (Optional[Dict]): Shared original -> iterator state, for callers
+                that spread one location's entries over several texts
+            spans (Optional[List]): When given, receives (start, end, replacement)
+                for every replacement made, in text order
+            
+        Returns:
+            Tuple[str, int]: New text and number of replacements made
+        """
+        if pending is None:
+            pending = {original: iter(entries) for original, entries in grouped.items()}
+        
+        # subn counts every match; only the (rare) untouched ones are tallied here
+        skipped = 0
+        
+        def substitute(match):
+            nonlocal skipped
+            original = match.group(0)
+            entry = next(pending[original], None)
+            replacement = render(entry) if entry is not None else None
+            if replacement is None:
+                skipped += 1
+                return original
+            if spans is not None:
+                spans.append((match.start(), match.end(), replacement))
+            return replacement
+        
+        text, matched = self._build_placeholder_pattern(grouped).subn(substitute, text)
+        return text, matched - skipped
+    
+    def _paragraph_text_nodes(self, paragraph) -> Tuple[List[Any], str]:
+        """
+        Collect the run-content nodes of a paragraph and their joined text.
+        
+        The nodes are the ones Paragraph.text is built from (<w:t> plus tabs,
+        breaks and non-breaking hyphens), so the joined text equals the text
+        placeholders were detected in.
+        
+        Args:
+            paragraph: python-docx Paragraph
+            
+        Returns:
+            Tuple[List, str]: Nodes in document order and their concatenated text
+        """
+        nodes = PARAGRAPH_TEXT_NODES(paragraph._p)
+        return nodes, ''.join([_run_content_text(node) for node in nodes])
+    
+    def _apply_text_spans(self, paragraph, nodes: List[Any],
+                          spans: List[Tuple[int, int, str]]) -> None:
+        """
+        Write replacements into the run nodes they cover, keeping run formatting.
+        
+        A replacement that starts in one node and ends in a later one is written
+        into the first node and the covered text is trimmed from the others.
+        Tabs and breaks covered by a placeholder are removed; when a placeholder
+        starts with one, the replacement goes into a new <w:t> in its place.
+        Tabs and line breaks in a replacement become <w:tab/>/<w:br/> elements
+        in the same run (see _set_node_text); the paragraph's other tabs and
+        breaks are left in place.
+        Paragraphs are rewritten one at a time on the calling thread: python-docx
+        wrappers and the underlying lxml tree are not safe to mutate concurrently.
+        
+        Args:
+            paragraph: python-docx Paragraph being updated
+            nodes (List): Run-content nodes from _paragraph_text_nodes
+            spans (List[Tuple[int, int, str]]): (start, end, replacement) offsets
+                into the joined node text
+        """
+        # Offset of each node within the joined text (tabs and breaks never change,
+        # <w:t> text is re-read below as earlier spans may have rewritten it)
+        starts = []
+        offset = 0
+        for node in nodes:
+            starts.append(offset)
+            offset += len(_run_content_text(node))
+        
+        # Right to left, so offsets of spans not yet applied stay valid
+        for start, end, replacement in sorted(spans, reverse=True):
+            node_idx = bisect_right(starts, start) - 1
+            node = nodes[node_idx]
+            if node.tag != W_T:
+                # Span opens on a tab or break: write into a new <w:t> in the same run
+                t = node.makeelement(W_T, {})
+                node.addprevious(t)
+                node.getparent().remove(node)
+                text = ''
+                node_end = starts[node_idx] + 1
+            else:
+                t = node
+                text = t.text or ''
+                node_end = starts[node_idx] + len(text)
+            local = start - starts[node_idx]
+            
+            if end <= node_end:
+                self._set_node_text(t, text[:local] + replacement + text[end - starts[node_idx]:])
+                continue
+            
+            # Placeholder split across runs: keep the first run's formatting
+            self._set_node_text(t, text[:local] + replacement)
+            for next_idx in range(node_idx + 1, len(nodes)):
+                node = nodes[next_idx]
+                if node.tag != W_T:
+                    if starts[next_idx] >= end:
+                        break
+                    # Page breaks carry no text and stay where they are
+                    if _run_content_text(node):
+                        node.getparent().remove(node)
+                    continue
+                text = node.text or ''
+                if end >= starts[next_idx] + len(text):
+                    node.text = ''
+                else:
+                    self._set_node_text(node, text[end - starts[next_idx]:])
+                    break
+    
+    def _set_node_text(self, t, text: str) -> None:
+        """
+        Set the text of a <w:t> node, preserving leading/trailing whitespace.
+        
+        Tabs and line breaks cannot be <w:t> text: the node keeps the text up to
+        the first of them, and the rest follows it in the same run as <w:tab/>,
+        <w:br/> and further <w:t> elements, so it keeps the run's formatting.
+        
+        Args:
+            t: <w:t> element
+            text (str): New node text
+        """
+        parts = RUN_BREAK_CHARS_RE.split(text)
+        self._set_plain_node_text(t, parts[0])
+        
+        anchor = t
+        for i in range(1, len(parts), 2):
+            element = t.makeelement(W_TAB if parts[i] == '\t' else W_BR, {})
+            anchor.addnext(element)
+            anchor = element
+            if parts[i + 1]:
+                node = t.makeelement(W_T, {})
+                self._set_plain_node_text(node, parts[i + 1])
+                anchor.addnext(node)
+                anchor = node
+    
+    def _set_plain_node_text(self, t, text: str) -> None:
+        """
+        Set the text (without tabs or line breaks) of a <w:t> node, preserving
+        leading/trailing whitespace.
+        
+        Args:
+            t: <w:t> element
+            text (str): New node text
+        """
+        t.text = text
+        if text != text.strip():
+            t.set(XML_SPACE, 'preserve')
+    
+    def _render_paragraph(self, text: str, style: str, states: Tuple[Tuple, ...]) -> str:
+        """
+        Render one preview paragraph as a <p> element.
+        
+        The output depends only on the arguments, which is what allows
+        _render_paragraph_cached to memoize it.
+        
+        Args:
+            text (str): Paragraph text
+            style (str): Paragraph style name
+            states (Tuple[Tuple, ...]): Span states (see _preview_span_state) of the
+                placeholders in this paragraph, in placeholder order
+            
+        Returns:
+            str: HTML paragraph
+        """
+        # Replace placeholders with highlighted versions (only for THIS paragraph)
+        # in a single regex pass; the n-th occurrence of a pattern belongs to the
+        # n-th placeholder sharing that text, so nothing is replaced twice
+        if states:
+            grouped = {}
+            for state in states:
+                grouped.setdefault(state[4], []).append(state)
+            text, _ = self._substitute_placeholders(text, grouped, self._render_span_state)
+        
+        # Apply paragraph styling based on style name
+        style_lower = style.lower()
+        style_class = 'paragraph'
+        if 'heading' in style_lower:
+            style_class = 'heading'
+        elif 'title' in style_lower:
+            style_class = 'title'
+        
+        # Escape any remaining HTML entities
+        text = self._escape_html(text, preserve_spans=True)
+        
+        return f'<p class="{style_class}">{text}</p>'
+    
+    def _preview_span_state(self, idx: int, placeholder: Dict, filled_values: Dict[str, str],
+                            current_index: Optional[int]) -> Tuple:
+        """
+        Capture everything the preview span of one placeholder depends on.
+        
+        Args:
+            idx (int): Index of the placeholder in the placeholder list
+            placeholder (Dict): Placeholder information
+            filled_values (Dict[str, str]): Dictionary of filled placeholder values
+            current_index (Optional[int]): Index of current field being filled
+            
+        Returns:
+            Tuple: (index, name, id, key, original, status, value) where status is
+                'current', 'filled' or 'unfilled' and value is None unless filled
+        """
+        placeholder_key = placeholder['key']
+        placeholder_id = placeholder.get('id', placeholder_key)
+        
+        if current_index is not None and idx == current_index:
+            status, value = 'current', None
+        # Check filled status by ID first, then key as fallback
+        elif placeholder_id in filled_values or placeholder_key in filled_values:
+            status, value = 'filled', filled_values.get(placeholder_id, filled_values.get(placeholder_key, ''))
+        else:
+            status, value = 'unfilled', None
+        
+        return (idx, placeholder.get('name', 'Field'), placeholder_id, placeholder_key,
+                placeholder['original'], status, value)
+    
+    def _render_span_state(self, state: Tuple) -> str:
+        """
+        Render the highlighted HTML span for one placeholder in the preview.
+        
+        Args:
+            state (Tuple): Span state from _preview_span_state
+            
+        Returns:
+            str: HTML span for the placeholder
+        """
+        idx, name, placeholder_id, placeholder_key, original, status, value = state
+        
+        ctx = {
+            'name': name,
+            'id': placeholder_id,
+            'key': placeholder_key,
+            'index': idx,
+            'original': original
+        }
+        
+        # Current field - highlight in RED with field name
+        if status == 'current':
+            return CURRENT_SPAN_TEMPLATE.format_map(ctx)
+        
+        # Filled field - show in GREEN with value and field name
+        if status == 'filled':
+            ctx['value'] = value
+            return FILLED_SPAN_TEMPLATE.format_map(ctx)
+        
+        # Unfilled field - show minimally (no highlight until it's current)
+        return UNFILLED_SPAN_TEMPLATE.format_map(ctx)
+    
+    def _render_cell_span(self, placeholder: Dict, filled_values: Dict[str, str]) -> str:
+        """
+        Render the HTML span for one placeholder inside a preview table cell.
+        
+        Args:
+            placeholder (Dict): Placeholder information
+            filled_values (Dict[str, str]): Dictionary of filled placeholder values
+            
+        Returns:
+            str: HTML span for the placeholder
+        """
+        placeholder_id = placeholder.get('id', placeholder['key'])
+        # Check by ID first, then key as fallback
+        if placeholder_id in filled_values or placeholder['key'] in filled_values:
+            value = filled_values.get(placeholder_id, filled_values.get(placeholder['key'], ''))
+            return f'<span class="placeholder-filled">{value}</span>'
+        return f'<span class="placeholder-unfilled">{placeholder["original"]}</span>'
+    
     def generate_final_document(self, template_path: str, output_path: str,
                                placeholders: List[Dict], filled_values: Dict[str, str]) -> bool:
         """
@@ -488,98 +1325,72 @@ class DocumentProcessor:
             doc = Document(template_path)
             logger.info(f"Loaded template document: {template_path}")
             
-            # Track replacements made
-            replacements_made = 0
+            replacements_made = self._fill_document(doc, placeholders, filled_values)
             
-            # NOTE: Removed auto-fill logic - context-aware deduplication in placeholder_detector.py
-            # now handles duplicate $[___] patterns correctly by differentiating based on context
-            # (Purchase Amount vs Valuation Cap). Each field gets its own value from filled_values.
+            # Save the completed document
+            doc.save(output_path)
+            logger.info(f"Successfully generated document with {replacements_made} replacements: {output_path}")
             
-            # Process all paragraphs - match by ORIGINAL document indices
-            for i, paragraph in enumerate(doc.paragraphs):
-                if not paragraph.text.strip():
-                    continue  # Skip empty but keep index counting
-                
-                paragraph_text = paragraph.text
-                text_changed = False
-                
-                # Filter placeholders that belong to THIS paragraph
-                para_placeholders = [
-                    p for p in placeholders 
-                    if p.get('location_type') == 'paragraph' and p.get('location') == i
-                ]
-                
-                # Replace each placeholder with its specific value
-                for placeholder in para_placeholders:
-                    placeholder_id = placeholder.get('id', placeholder['key'])
-                    # Check by ID first, then key as fallback
-                    if (placeholder_id in filled_values or placeholder['key'] in filled_values) and placeholder['original'] in paragraph_text:
-                        old_value = placeholder['original']
-                        new_value = filled_values.get(placeholder_id, filled_values.get(placeholder['key'], ''))
-                        
-                        # Replace only this occurrence
-                        paragraph_text = paragraph_text.replace(old_value, new_value, 1)
-                        text_changed = True
-                        replacements_made += 1
-                        
-                        logger.info(f"Replaced '{placeholder['name']}' (id: {placeholder_id}) in para {i}: '{old_value}' → '{new_value}'")
-                
-                # Handle auto-fill for header Company Name
-                if '[Company Name]' in paragraph_text:
-                    for ph in placeholders:
-                        ph_id = ph.get('id', ph['key'])
-                        if ph['name'] == 'Company Name' and (ph_id in filled_values or ph['key'] in filled_values):
-                            value = filled_values.get(ph_id, filled_values.get(ph['key'], ''))
-                            paragraph_text = paragraph_text.replace('[Company Name]', value, 1)
-                            text_changed = True
-                            replacements_made += 1
-                            break
-                
-                # Update paragraph if text changed
-                if text_changed:
-                    # Clear existing runs and add new text as single run
-                    paragraph.clear()
-                    paragraph.add_run(paragraph_text)
-            
-            # Process all tables
-            for table_idx, table in enumerate(doc.tables):
-                for row_idx, row in enumerate(table.rows):
-                    for col_idx, cell in enumerate(row.cells):
-                        # Process each paragraph in the cell
-                        for paragraph in cell.paragraphs:
-                            # Replace at paragraph level to handle placeholders split across runs
-                            paragraph_text = paragraph.text
-                            text_changed = False
-                            
-                            # Build location key for this table cell
-                            table_location = f"{table_idx}-{row_idx}-{col_idx}"
-                            
-                            # Replace placeholders that match THIS table cell location
-                            for placeholder in placeholders:
-                                # Check if this placeholder belongs to this table cell
-                                placeholder_id = placeholder.get('id', placeholder['key'])
-                                if (placeholder.get('location_type') == 'table' and
-                                    str(placeholder.get('location')) == table_location and
-                                    placeholder['original'] in paragraph_text and 
-                                    (placeholder_id in filled_values or placeholder['key'] in filled_values)):
-                                    
-                                    value = filled_values.get(placeholder_id, filled_values.get(placeholder['key'], ''))
-                                    paragraph_text = paragraph_text.replace(
-                                        placeholder['original'],
-                                        value,
-                                        1  # Replace only first occurrence
-                                    )
-                                    replacements_made += 1
-                                    text_changed = True
-                                    logger.debug(f"Replaced {placeholder['name']} (id: {placeholder_id}) in table {table_location}")
-                            
-                            # Only update if text changed
-                            if text_changed:
-                                # Clear existing runs and add new text as single run
-                                paragraph.clear()
-                                paragraph.add_run(paragraph_text)
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error generating final document: {str(e)}")
+            return False
+    
+    def generate_batch(self, template_path: str,
+                       jobs: List[Tuple[str, List[Dict], Dict[str, str]]]) -> List[bool]:
+        """
+        Generate several filled documents from one template in parallel.
+        
+        The template is read from disk once and handed to each worker process,
+        so every job only pays for its own load, fill and save.
+        
+        Args:
+            template_path (str): Path to the template document
+            jobs (List[Tuple]): (output_path, placeholders, filled_values) per document
+            
+        Returns:
+            List[bool]: Success flag for each job, in job order
+        """
+        if not os.path.exists(template_path):
+            logger.error(f"Template document not found: {template_path}")
+            return [False] * len(jobs)
+        
+        with open(template_path, 'rb') as f:
+            template_bytes = f.read()
+        
+        # A single job is not worth the process start-up cost
+        if len(jobs) <= 1:
+            return [self.generate_from_bytes(template_bytes, *job) for job in jobs]
+        
+        workers = min(len(jobs), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                                 initargs=(template_bytes,)) as executor:
+            results = list(executor.map(_run_batch_job, jobs))
+        
+        logger.info(f"Generated {sum(results)}/{len(jobs)} documents from template: {template_path}")
+        return results
+    
+    def generate_from_bytes(self, template_bytes: bytes, output_path: str,
+                            placeholders: List[Dict], filled_values: Dict[str, str]) -> bool:
+        """
+        Generate a final document from template bytes already in memory.
+        
+        Args:
+            template_bytes (bytes): Raw DOCX template content
+            output_path (str): Path where the final document should be saved
+            placeholders (List[Dict]): List of placeholders to replace
+            filled_values (Dict[str, str]): Dictionary of values to insert
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            Path(os.path.dirname(output_path)).mkdir(parents=True, exist_ok=True)
+            
+            doc = Document(io.BytesIO(template_bytes))
+            replacements_made = self._fill_document(doc, placeholders, filled_values)
             
-            # Save the completed document
             doc.save(output_path)
             logger.info(f"Successfully generated document with {replacements_made} replacements: {output_path}")
             
@@ -589,7 +1400,138 @@ class DocumentProcessor:
             logger.error(f"Error generating final document: {str(e)}")
             return False
     
-    def validate_document_structure(self, filepath: str) -> Dict[str, Any]:
+    def _fill_document(self, doc: Document, placeholders: List[Dict],
+                       filled_values: Dict[str, str]) -> int:
+        """
+        Replace placeholders in a loaded document in place.
+        
+        Args:
+            doc (Document): Loaded python-docx document
+            placeholders (List[Dict]): List of placeholders to replace
+            filled_values (Dict[str, str]): Dictionary of values to insert
+            
+        Returns:
+            int: Number of replacements made
+        """
+        # Track replacements made
+        replacements_made = 0
+        
+        # NOTE: Removed auto-fill logic - context-aware deduplication in placeholder_detector.py
+        # now handles duplicate $[___] patterns correctly by differentiating based on context
+        # (Purchase Amount vs Valuation Cap). Each field gets its own value from filled_values.
+        
+        # Index placeholders by location once instead of filtering per paragraph/cell
+        by_para, by_table = self._index_placeholders(placeholders)
+        
+        # The filled Company Name placeholder also auto-fills the first leftover
+        # (unfilled or undetected) "[Company Name]" of each paragraph, e.g. in
+        # headers; it rides along in the paragraph's alternation after the
+        # placeholders detected there
+        company_entry = None
+        for idx, ph in enumerate(placeholders):
+            ph_id = ph.get('id', ph['key'])
+            if ph['name'] == 'Company Name' and (ph_id in filled_values or ph['key'] in filled_values):
+                company_entry = (idx, ph)
+                break
+        
+        # Process all paragraphs - match by ORIGINAL document indices
+        for i, paragraph in enumerate(doc.paragraphs):
+            # Placeholders that belong to THIS paragraph
+            para_placeholders = by_para.get(i)
+            
+            # Fast path: nothing can be replaced, so the paragraph text is never read
+            # (also skips empty paragraphs but keeps index counting)
+            if not para_placeholders and company_entry is None:
+                continue
+            
+            # Work on the run text nodes directly so run formatting survives
+            nodes, run_text = self._paragraph_text_nodes(paragraph)
+            if not para_placeholders and '[Company Name]' not in run_text:
+                continue
+            
+            grouped = self._group_by_original(para_placeholders) if para_placeholders else {}
+            if company_entry is not None:
+                grouped.setdefault('[Company Name]', []).append(company_entry)
+            
+            autofill_left = company_entry is not None
+            
+            def render(entry):
+                nonlocal autofill_left
+                value = None if entry is company_entry else self._filled_value(entry[1], filled_values, f"para {i}")
+                if value is None and autofill_left and (entry is company_entry or entry[1]['original'] == '[Company Name]'):
+                    autofill_left = False
+                    value = self._filled_value(company_entry[1], filled_values, f"para {i}")
+                return value
+            
+            # Replace each placeholder with its specific value (single regex pass,
+            # each occurrence goes to the placeholder at that position)
+            spans = []
+            _, count = self._substitute_placeholders(run_text, grouped, render, spans=spans)
+            replacements_made += count
+            
+            # Update paragraph if text changed
+            if spans:
+                self._apply_text_spans(paragraph, nodes, spans)
+        
+        # Process all tables
+        for table_idx, table in enumerate(doc.tables):
+            for row_idx, row_tcs in enumerate(_table_grid(table._tbl)):
+                for col_idx, tc in enumerate(row_tcs):
+                    # Build location key for this table cell
+                    table_location = f"{table_idx}-{row_idx}-{col_idx}"
+                    
+                    # Placeholders that match THIS table cell location
+                    cell_placeholders = by_table.get(table_location)
+                    if not cell_placeholders:
+                        continue
+                    
+                    # Occurrences are consumed in order across all paragraphs of the cell
+                    grouped = self._group_by_original(cell_placeholders)
+                    pending = {original: iter(entries) for original, entries in grouped.items()}
+                    
+                    # Process each paragraph in the cell (_Cell only built for cells with placeholders)
+                    for paragraph in _Cell(tc, table).paragraphs:
+                        # Match on the joined run text to handle placeholders split across runs
+                        nodes, run_text = self._paragraph_text_nodes(paragraph)
+                        spans = []
+                        _, count = self._substitute_placeholders(
+                            run_text,
+                            grouped,
+                            lambda entry: self._filled_value(entry[1], filled_values, f"table {table_location}"),
+                            pending,
+                            spans
+                        )
+                        replacements_made += count
+                        
+                        # Only update if text changed
+                        if spans:
+                            self._apply_text_spans(paragraph, nodes, spans)
+        
+        return replacements_made
+    
+    def _filled_value(self, placeholder: Dict, filled_values: Dict[str, str],
+                      where: str) -> Optional[str]:
+        """
+        Look up the filled value for a placeholder, or None if it is unfilled.
+        
+        Args:
+            placeholder (Dict): Placeholder information
+            filled_values (Dict[str, str]): Dictionary of values to insert
+            where (str): Location description used for logging
+            
+        Returns:
+            Optional[str]: Value to insert, None to keep the placeholder text
+        """
+        placeholder_id = placeholder.get('id', placeholder['key'])
+        # Check by ID first, then key as fallback
+        if placeholder_id not in filled_values and placeholder['key'] not in filled_values:
+            return None
+        
+        value = filled_values.get(placeholder_id, filled_values.get(placeholder['key'], ''))
+        logger.info(f"Replaced '{placeholder['name']}' (id: {placeholder_id}) in {where}: '{placeholder['original']}' → '{value}'")
+        return value
+    
+    def validate_document_structure(self, filepath: str) -> ValidationResult:
         """
         Validate document structure and identify potential issues.
         
@@ -603,45 +1545,251 @@ class DocumentProcessor:
             filepath (str): Path to the document to validate
             
         Returns:
-            Dict[str, Any]: Validation results with issues and warnings
+            ValidationResult: Validation results with issues and warnings
+        """
+        return self._analyze(filepath, with_text=False)[0]
+    
+    def extract_text_only(self, filepath: str, normalize_whitespace: bool = False) -> str:
+        """
+        Extract plain text from a document without formatting.
+        
+        Args:
+            filepath (str): Path to the document
+            normalize_whitespace (bool): Collapse whitespace runs inside each
+                paragraph/cell into single spaces (one paragraph or cell per line)
+            
+        Returns:
+            str: Plain text content of the document
+        """
+        doc_text = self._analyze(filepath, with_text=True)[1]
+        if normalize_whitespace:
+            return '\n'.join([_collapse_whitespace(part) for part in doc_text.paragraphs + doc_text.cells])
+        return doc_text.text
+    
+    def extract_paragraphs(self, filepath: str) -> List[str]:
+        """
+        Extract the stripped text of each non-empty body paragraph.
+        
+        Args:
+            filepath (str): Path to the document
+            
+        Returns:
+            List[str]: Paragraph texts in document order
+        """
+        return list(self._analyze(filepath, with_text=True)[1].paragraphs)
+    
+    def extract_cells(self, filepath: str) -> List[str]:
+        """
+        Extract the stripped text of each non-empty table cell.
+        
+        Args:
+            filepath (str): Path to the document
+            
+        Returns:
+            List[str]: Cell texts in document order (merged cells once)
+        """
+        return list(self._analyze(filepath, with_text=True)[1].cells)
+    
+    def iter_text(self, filepath: str, normalize_whitespace: bool = False) -> Iterator[str]:
         """
+        Stream a document's plain text one paragraph or cell at a time.
+        
+        Paragraphs are yielded as soon as they are read; table cell text follows
+        the last paragraph, so '\\n'.join(iter_text(filepath)) equals
+        extract_text_only(filepath). Unlike extract_text_only, nothing is cached.
+        
+        Args:
+            filepath (str): Path to the document
+            normalize_whitespace (bool): Collapse whitespace runs inside each
+                paragraph/cell into single spaces
+            
+        Yields:
+            str: Stripped text of each non-empty paragraph, then of each non-empty cell
+                (nothing at all when the document cannot be opened)
+            
+        Raises:
+            Exception: Read errors that occur after text has been yielded, so a
+                truncated stream is never mistaken for the whole document
+        """
+        clean = _collapse_whitespace if normalize_whitespace else str.strip
+        cells = []
+        yielded = False
         try:
-            validation_result = {
-                'valid': True,
-                'issues': [],
-                'warnings': [],
-                'stats': {}
-            }
+            for element in self._iter_docx_body(filepath):
+                if element.tag == W_P:
+                    para_text = _paragraph_text(element)
+                    if para_text and not para_text.isspace():
+                        yielded = True
+                        yield clean(para_text)
+                elif element.tag == W_TBL:
+                    cells.extend(_table_cell_texts(element.iterchildren(W_TR)))
+        except Exception as e:
+            if yielded:
+                raise
+            logger.error("Error reading document %s: %s", filepath, e)
+            return
+        
+        yield from map(_collapse_whitespace, cells) if normalize_whitespace else cells
+    
+    def analyze(self, filepath: str) -> Tuple[ValidationResult, str]:
+        """
+        Validate a document and extract its plain text in a single pass.
+        
+        Equivalent to calling validate_document_structure and extract_text_only,
+        but the document is opened and streamed only once.
+        
+        Args:
+            filepath (str): Path to the document
+            
+        Returns:
+            Tuple[ValidationResult, str]: Validation results and plain text content
+        """
+        validation_result, doc_text = self._analyze(filepath, with_text=True)
+        return validation_result, doc_text.text
+    
+    def extract_text_batch(self, filepaths: List[str], max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Extract plain text from many documents in parallel worker processes.
+        
+        A file that cannot be read does not fail the batch: its entry carries
+        empty text and the validation issues explaining why.
+        
+        Args:
+            filepaths (List[str]): Paths of the documents to read
+            max_workers (Optional[int]): Worker process count (defaults to CPU count)
+            
+        Returns:
+            List[Dict[str, Any]]: Per file, in input order: filepath, text, valid and issues
+        """
+        # A single file is not worth the process start-up cost
+        if len(filepaths) <= 1:
+            return [_extract_text_job(filepath, self) for filepath in filepaths]
+        
+        cpu_count = os.cpu_count() or 1
+        workers = min(len(filepaths), max_workers or cpu_count)
+        chunksize = max(1, len(filepaths) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_extract_text_job, filepaths, chunksize=chunksize))
+        
+        logger.info(f"Extracted text from {sum(1 for result in results if result['text'])}/{len(filepaths)} documents")
+        return results
+    
+    def _analyze(self, filepath: str, with_text: bool) -> Tuple[ValidationResult, DocText]:
+        """
+        Validate and optionally extract text, reusing results for unchanged files.
+        
+        Args:
+            filepath (str): Path to the document
+            with_text (bool): Whether to extract text; when False, oversized files
+                are rejected without being read
             
+        Returns:
+            Tuple[ValidationResult, DocText]: Validation results (a fresh copy the caller
+                may mutate) and text content
+        """
+        try:
             # Check file exists
             if not os.path.exists(filepath):
-                validation_result['valid'] = False
-                validation_result['issues'].append('File does not exist')
-                return validation_result
+                return ValidationResult(valid=False, issues=['File does not exist'], warnings=[], stats={}), EMPTY_DOC_TEXT
+            
+            stat = os.stat(filepath)
+            validation_result, doc_text = self._analyze_cached(filepath, stat.st_mtime_ns, stat.st_size, with_text)
+            return validation_result.copy(), doc_text
+            
+        except Exception as e:
+            logger.exception("Error analyzing document %s", filepath)
+            return ValidationResult(valid=False, issues=[f'Validation error: {str(e)}'], warnings=[], stats={}), EMPTY_DOC_TEXT
+    
+    def _analyze_file(self, filepath: str, mtime_ns: int, size: int,
+                      with_text: bool) -> Tuple[ValidationResult, DocText]:
+        """
+        Walk the document body once, collecting validation stats and (optionally) text.
+        
+        mtime_ns is only part of the cache key; the returned validation dict is
+        shared by every cache hit and must be treated as read-only.
+        
+        Args:
+            filepath (str): Path to the document
+            mtime_ns (int): File modification time in nanoseconds
+            size (int): File size in bytes
+            with_text (bool): Whether to extract text
+            
+        Returns:
+            Tuple[ValidationResult, DocText]: Validation results and text content
+                (empty when text was not requested or could not be read)
+        """
+        try:
+            validation_result = ValidationResult(valid=True, issues=[], warnings=[], stats={})
             
             # Check file size
-            file_size_mb = os.path.getsize(filepath) / (1024 * 1024)
-            validation_result['stats']['file_size_mb'] = round(file_size_mb, 2)
+            file_size_mb = size / (1024 * 1024)
+            validation_result.stats['file_size_mb'] = round(file_size_mb, 2)
             
-            if file_size_mb > 10:
-                validation_result['valid'] = False
-                validation_result['issues'].append(f'File too large: {file_size_mb:.1f}MB (max 10MB)')
-                return validation_result
+            too_large = file_size_mb > 10
+            if too_large:
+                validation_result.valid = False
+                validation_result.issues.append(f'File too large: {file_size_mb:.1f}MB (max 10MB)')
+                if not with_text:
+                    return validation_result, EMPTY_DOC_TEXT
             
-            # Try to open the document
+            num_paragraphs = 0
+            num_tables = 0
+            num_sections = 0
+            table_warning = None
+            has_nested_tables = False
+            
+            # Paragraph and cell texts are collected as separate columns
+            paragraphs = []
+            cells = []
+            
+            # Stream the document body once, counting blocks as they complete; plain
+            # lxml elements are enough here, no python-docx classes are involved
             try:
-                doc = Document(filepath)
-            except:
-                validation_result['valid'] = False
-                validation_result['issues'].append('Unable to open document - file may be corrupted')
-                return validation_result
-            
-            # Count elements
-            num_paragraphs = len(doc.paragraphs)
-            num_tables = len(doc.tables)
-            num_sections = len(doc.sections)
-            
-            validation_result['stats'] = {
+                for element in self._iter_docx_body(filepath):
+                    if element.tag == W_P:
+                        num_paragraphs += 1
+                        # isspace() tests the original string in place; only
+                        # paragraphs that are kept get a stripped copy
+                        if with_text:
+                            para_text = _paragraph_text(element)
+                            if para_text and not para_text.isspace():
+                                paragraphs.append(para_text.strip())
+                    
+                    elif element.tag == W_TBL:
+                        num_tables += 1
+                        # One row list serves both the size check and the cell text walk
+                        rows = element.findall(W_TR)
+                        
+                        # Complex tables: only the first offending table is reported
+                        if table_warning is None:
+                            if len(rows) > 50:
+                                table_warning = 'Document contains very large tables (50+ rows)'
+                            elif len(element.findall(W_GRID_COLS)) > 10:
+                                table_warning = 'Document contains very wide tables (10+ columns)'
+                        
+                        # Nested tables: one XPath test per table until one is found
+                        if not has_nested_tables:
+                            has_nested_tables = HAS_NESTED_TABLE(element)
+                        
+                        if with_text:
+                            cells.extend(_table_cell_texts(rows))
+                    
+                    else:
+                        num_sections += 1
+            except Exception as e:
+                logger.error("Error reading document %s: %s", filepath, e)
+                if not too_large:
+                    validation_result.valid = False
+                    validation_result.issues.append('Unable to open document - file may be corrupted')
+                return validation_result, EMPTY_DOC_TEXT
+            
+            doc_text = DocText(tuple(paragraphs), tuple(cells))
+            
+            # Oversized files are rejected before any structural checks
+            if too_large:
+                return validation_result, doc_text
+            
+            validation_result.stats = {
                 'paragraphs': num_paragraphs,
                 'tables': num_tables,
                 'sections': num_sections,
@@ -650,69 +1798,72 @@ class DocumentProcessor:
             
             # Check for empty document
             if num_paragraphs == 0 and num_tables == 0:
-                validation_result['valid'] = False
-                validation_result['issues'].append('Document is empty')
+                validation_result.valid = False
+                validation_result.issues.append('Document is empty')
             
             # Check for extremely large documents
             if num_paragraphs > 1000:
-                validation_result['warnings'].append(f'Document is very large ({num_paragraphs} paragraphs) and may take time to process')
+                validation_result.warnings.append(f'Document is very large ({num_paragraphs} paragraphs) and may take time to process')
             
             # Check for complex tables
-            for table in doc.tables:
-                if len(table.rows) > 50:
-                    validation_result['warnings'].append('Document contains very large tables (50+ rows)')
-                    break
-                if len(table.columns) > 10:
-                    validation_result['warnings'].append('Document contains very wide tables (10+ columns)')
-                    break
+            if table_warning is not None:
+                validation_result.warnings.append(table_warning)
             
             # Check for nested tables (not supported well)
-            for table in doc.tables:
-                for row in table.rows:
-                    for cell in row.cells:
-                        if len(cell.tables) > 0:
-                            validation_result['warnings'].append('Document contains nested tables which may not display correctly')
-                            break
+            if has_nested_tables:
+                validation_result.warnings.append('Document contains nested tables which may not display correctly')
             
-            return validation_result
+            return validation_result, doc_text
             
         except Exception as e:
-            logger.error(f"Error validating document: {str(e)}")
-            return {
-                'valid': False,
-                'issues': [f'Validation error: {str(e)}'],
-                'warnings': [],
-                'stats': {}
-            }
+            logger.exception("Error analyzing document %s", filepath)
+            return ValidationResult(valid=False, issues=[f'Validation error: {str(e)}'], warnings=[], stats={}), EMPTY_DOC_TEXT
+
+
+class _MappedFile(mmap.mmap):
+    """Read-only memory map usable as a zipfile source (mmap lacks seekable() before 3.13)."""
     
-    def extract_text_only(self, filepath: str) -> str:
-        """
-        Extract plain text from a document without formatting.
-        
-        Args:
-            filepath (str): Path to the document
-            
-        Returns:
-            str: Plain text content of the document
-        """
-        try:
-            doc = Document(filepath)
-            text_parts = []
-            
-            # Extract text from paragraphs
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    text_parts.append(paragraph.text.strip())
-            
-            # Extract text from tables
-            for table in doc.tables:
-                for row in table.rows:
-                    for cell in row.cells:
-                        if cell.text.strip():
-                            text_parts.append(cell.text.strip())
-            
-            return '\n'.join(text_parts)
-            
-        except Exception as e:
-            logger.error(f"Error extracting text: {str(e)}")
-            return ""
\ No newline at end of file
+    def seekable(self) -> bool:
+        return True
+
+
+# Template bytes for batch workers, set once per process by _init_batch_worker
+_batch_template: Optional[bytes] = None
+
+
+def _init_batch_worker(template_bytes: bytes) -> None:
+    """Store the template bytes in a batch worker process."""
+    global _batch_template
+    _batch_template = template_bytes
+
+
+def _run_batch_job(job: Tuple[str, List[Dict], Dict[str, str]]) -> bool:
+    """Generate one document of a batch inside a worker process."""
+    output_path, placeholders, filled_values = job
+    return DocumentProcessor().generate_from_bytes(_batch_template, output_path, placeholders, filled_values)
+
+
+# Batch text workers run a full collection after this many documents, so
+# reference cycles left by parsed documents do not pile up over a long batch
+GC_EVERY_DOCUMENTS = 50
+
+# Documents extracted by this process since its last collection
+_extract_jobs_since_gc = 0
+
+
+def _extract_text_job(filepath: str, processor: Optional[DocumentProcessor] = None) -> Dict[str, Any]:
+    """Extract one document's text for extract_text_batch (runs in a worker process)."""
+    global _extract_jobs_since_gc
+    validation_result, text = (processor or DocumentProcessor()).analyze(filepath)
+    
+    _extract_jobs_since_gc += 1
+    if _extract_jobs_since_gc >= GC_EVERY_DOCUMENTS:
+        _extract_jobs_since_gc = 0
+        gc.collect()
+    
+    return {
+        'filepath': filepath,
+        'text': text,
+        'valid': validation_result.valid,
+        'issues': validation_result.issues
+    }
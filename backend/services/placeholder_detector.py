@@ -7,7 +7,6 @@ analysis, and legal terminology understanding.
 
 This module provides:
 - Multiple pattern detection ({{}}, [], __, <> formats)
-- Contextual placeholder identification
 - Type inference based on placeholder names
 - Grouping of related placeholders
 - Value suggestions based on context
@@ -19,14 +18,290 @@ Version: 1.0.0
 
 import re
 import logging
+import secrets
+import sys
+from bisect import bisect_right
 from typing import List, Dict, Any, Optional, Set, Tuple
-from collections import OrderedDict
+from collections import defaultdict
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from uuid import uuid4
+from functools import lru_cache
+from string import capwords
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Fixed helper patterns, compiled once at import
+NONALNUM_RE = re.compile(r'[^a-z0-9]+')
+PLACEHOLDER_KEY_RE = re.compile(r'^[a-z0-9_]+$')
+
+# Group of related placeholders for each placeholder type; placeholders of other
+# types are grouped as legal terms when their name has one of LEGAL_TERM_WORDS
+PLACEHOLDER_TYPE_GROUPS = {
+    'company': 'company_info',
+    'person': 'personal_info',
+    'date': 'dates',
+    'amount': 'financial',
+    'percentage': 'financial',
+    'number': 'financial',
+    'contact': 'contact',
+    'address': 'addresses',
+}
+LEGAL_TERM_WORDS = ('governing', 'jurisdiction', 'law', 'notice')
+
+# Suggested values by placeholder type: (keywords, suggestions) entries checked in
+# order against the name, and the suggestions when none of them match
+KEYWORD_SUGGESTIONS = {
+    'percentage': (
+        (
+            (('discount',), ('20%', '15%', '10%', '25%')),
+            (('interest',), ('5%', '7%', '10%', '12%')),
+            (('commission',), ('5%', '10%', '15%', '20%')),
+        ),
+        ('10%', '25%', '50%'),
+    ),
+    'amount': (
+        (
+            (('valuation',), ('$5,000,000', '$10,000,000', '$25,000,000')),
+            (('investment', 'purchase'), ('$100,000', '$250,000', '$500,000', '$1,000,000')),
+            (('fee',), ('$1,000', '$5,000', '$10,000')),
+        ),
+        ('$10,000', '$50,000', '$100,000'),
+    ),
+}
+
+# Fixed suggested values (copied into a new list per call: callers may mutate it)
+FUTURE_DATE_OFFSETS_DAYS = (30, 90, 365)  # 30 days, 90 days, 1 year
+COMPANY_NAME_SUGGESTIONS = ('[Company Name], Inc.', '[Company Name] LLC', '[Company Name] Corporation')
+INCORPORATION_STATE_SUGGESTIONS = ('Delaware', 'Nevada', 'Wyoming', 'California', 'New York')
+STATE_SUGGESTIONS = ('California', 'New York', 'Texas', 'Florida', 'Illinois')
+TITLE_SUGGESTIONS = ('Chief Executive Officer', 'President', 'Chief Financial Officer',
+                     'Vice President', 'Secretary', 'Director')
+SHARE_COUNT_SUGGESTIONS = ('1,000,000', '10,000,000', '100,000', '500,000')
+
+# Placeholder types accepted by validate_placeholder_format
+VALID_PLACEHOLDER_TYPES = frozenset([
+    'company', 'person', 'date', 'amount', 'percentage',
+    'address', 'contact', 'number', 'signature', 'text'
+])
+
+# Common variations of a normalized key mapped to one key per field; keys not
+# listed map to themselves
+# CRITICAL: purchase_amount and valuation_cap are SEPARATE fields!
+NORMALIZED_KEY_MAPPINGS = {
+    'company': 'company_name',
+    'investor': 'investor_name',
+    'safe_date': 'date_of_safe',
+    # Valuation Cap variations - all map to same key
+    'valuation_cap_amount': 'valuation_cap',
+    'post_money_valuation_cap': 'valuation_cap',
+    'postmoney_valuation_cap': 'valuation_cap',
+    'governing_law': 'governing_law_jurisdiction',
+    # Keep 'name' and 'title' as separate fields (signature fields)
+    'name': 'signatory_name',
+    'title': 'signatory_title',
+}
+
+# Context keywords that name a blank placeholder outright, in priority order:
+# Valuation Cap indicators FIRST (more specific), then Purchase Amount
+# ('valuation cap' also covers "post-money/post money valuation cap")
+CONTEXT_NAME_KEYWORDS = [
+    (('valuation cap', 'post money'), 'Post-Money Valuation Cap'),
+    (('purchase amount', 'payment by', 'exchange for'), 'Purchase Amount'),
+]
+# One group per name inside a lookahead (see SPECIAL_NAME_TYPE_RE below)
+CONTEXT_NAME_KEYWORD_RE = re.compile(
+    '(?=' + '|'.join(
+        '(' + '|'.join(re.escape(keyword) for keyword in keywords) + ')'
+        for keywords, _ in CONTEXT_NAME_KEYWORDS
+    ) + ')'
+)
+
+# Common patterns before a blank placeholder whose group 1 names it, tried in
+# order when inferring the name from context, each with the last character it
+# can match. The text they search is stripped, so a pattern whose last character
+# does not match the text's is skipped without scanning it. Word-run patterns are
+# anchored at the start of a letter run: the same leftmost matches, without
+# retrying from every letter of each word. A pattern only scans the text when
+# its separator already ends it, so a hand-written scanner would save little
+INFER_NAME_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), re.compile(last_char, re.IGNORECASE))
+    for pattern, last_char in [
+        (r'(?<![A-Za-z])([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+is\s*$', 's'),  # "Purchase Amount is"
+        (r'(?<![A-Za-z])([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s*[:\-]\s*$', r'[:\-]'),  # "Company Name: _____"
+        (r'[Bb]y\s+([A-Za-z\s]+?)[:]\s*$', ':'),  # "by Investor Name:" or "By: _____"
+        (r'^([A-Za-z\s]+):\s*$', ':'),  # "Name:" at start
+        (r'([A-Z][A-Za-z\s]{3,30})\s+(?:of|for)\s*$', '[fr]'),  # "State of Incorporation"
+        (r'(?<![A-Za-z])([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s*\($', r'\('),  # "Name ("
+    ]
+]
+# Articles dropped from the front of an inferred name
+LEADING_ARTICLES = ('the', 'a', 'an')
+# Parenthetical hint right after a blank: "_____ (explanation)"
+PAREN_HINT_RE = re.compile(r'^\s*\(([^)]+)\)')
+SURROUNDING_QUOTES_RE = re.compile(r'^["\']+|["\']+$')
+
+# Compound phrases that decide a placeholder's type before the type indicators
+# are checked, in priority order (e.g. "State of Incorporation" should be
+# 'address', not 'company')
+# IMPORTANT: address fields come FIRST to override 'party' matching in person type
+SPECIAL_NAME_TYPES = [
+    ('address', 'address'),
+    ('state of incorporation', 'address'),
+    ('governing law', 'address'),
+    ('valuation cap', 'amount'),
+    ('discount rate', 'percentage'),
+    ('purchase amount', 'amount'),
+    ('date of safe', 'date'),
+    ('safe date', 'date'),
+    ('investor name', 'person'),
+    ('company name', 'company'),
+]
+# One group per phrase inside a lookahead, so overlapping phrases are all found
+# and match.lastindex is the phrase's 1-based rank
+SPECIAL_NAME_TYPE_RE = re.compile(
+    '(?=' + '|'.join(f'({re.escape(phrase)})' for phrase, _ in SPECIAL_NAME_TYPES) + ')'
+)
+
+# Instruction words stripped from the front of placeholder names, in order (each
+# at most once, in Title or UPPER case): one optional group per prefix, so a
+# single match strips the same prefixes as checking them one after another
+NAME_PREFIXES = ['Insert', 'Enter', 'Add', 'Input', 'Type', 'Provide', 'Fill']
+NAME_PREFIX_RE = re.compile(''.join(f'(?:(?:{prefix}|{prefix.upper()}) )?' for prefix in NAME_PREFIXES))
+
+# Abbreviations expanded in placeholder names - only on whole-word matches
+NAME_ABBREVIATIONS = {
+    'Co.': 'Company',
+    'Corp.': 'Corporation',
+    'Inc.': 'Incorporated',
+    'Addr': 'Address',
+    'Amt': 'Amount',
+    'Pct': 'Percentage',
+    'No.': 'Number',
+    'Tel': 'Telephone',
+    'Qty': 'Quantity'
+}
+NAME_ABBREVIATION_PATTERNS = [
+    (re.compile(r'\b' + re.escape(old) + r'\b'), new) for old, new in NAME_ABBREVIATIONS.items()
+]
+# Any abbreviation at all: most names have none and skip the per-abbreviation passes
+NAME_ABBREVIATION_RE = re.compile(r'\b(?:' + '|'.join(re.escape(old) for old in NAME_ABBREVIATIONS) + r')\b')
+
+# Literal text every match of a detection pattern ends with. No match can end
+# after the last occurrence of its closer, so scans stop there (and patterns
+# whose closer does not occur are skipped): an unclosed "[" or "{{" is then
+# not rescanned to the end of the text from every later opener
+PATTERN_CLOSERS = {
+    'dollar_bracket': ']',
+    'square_bracket': ']',
+    'double_curly': '}}',
+    'underscore': '__',
+    'angle_bracket': '>',
+    'insert_style': ']',
+    'blank_with_description': ')',
+    'field_with_blank': '___',
+}
+
+# Literal text every match of a detection pattern starts with (None: the match
+# starts with the label before it). No match starts before the first occurrence
+# of its opener, so scans start there, and patterns whose opener does not occur
+# are skipped. The first '___' always begins an underscore run, so the
+# blank_with_description lookbehind still holds from there
+PATTERN_OPENERS = {
+    'dollar_bracket': '$[',
+    'square_bracket': '[',
+    'double_curly': '{{',
+    'underscore': '__',
+    'angle_bracket': '<',
+    'insert_style': '[',
+    'blank_with_description': '___',
+    'field_with_blank': None,
+}
+
+# Every detection pattern's match contains one of these literals; text without
+# any of them (most prose) is rejected with plain substring checks, before any
+# regex runs
+PLACEHOLDER_TRIGGERS = ('[', '{{', '__', '<')
+
+# Joins paragraph/cell texts into one buffer scanned once per pattern. NUL cannot
+# occur in DOCX text (XML 1.0 forbids it) and the patterns' negated classes
+# exclude it, so no match spans two texts
+SEGMENT_SEPARATOR = '\x00'
+
+
+@dataclass
+class Placeholder:
+    """
+    One detected placeholder occurrence while detection runs: fixed attributes
+    instead of a dict per match.
+    
+    Holds only what deduplication and filtering need (plus the text the match
+    came from): the id, type and context are worked out in to_dict, for the
+    occurrences that survive, when they become the dicts the rest of the
+    application works with. The public helpers (group_related_placeholders,
+    suggest_placeholder_values, validate_placeholder_format) take those dicts,
+    as returned by the API and stored in sessions.
+    """
+    __slots__ = ('normalized_key', 'name', 'original', 'pattern_type',
+                 'location', 'location_type', 'position', 'text')
+    
+    normalized_key: str
+    name: str
+    original: str
+    pattern_type: str
+    location: Any
+    location_type: str
+    position: Tuple[int, int]
+    text: str
+    
+    def to_dict(self, occurrence_id: str, placeholder_type: str, context: str) -> Dict[str, Any]:
+        """
+        Return the placeholder dict handed to callers of detect_placeholders.
+        
+        Args:
+            occurrence_id (str): Per-occurrence id
+            placeholder_type (str): Type identified from the name
+            context (str): Text around the placeholder
+            
+        Returns:
+            Dict[str, Any]: Placeholder with metadata
+        """
+        return {
+            'id': occurrence_id,  # NEW: per-occurrence id
+            'key': f"{self.normalized_key}_{self.location}",
+            'normalized_key': self.normalized_key,  # For deduplication
+            'name': self.name,
+            'original': self.original,
+            'type': placeholder_type,
+            'pattern_type': self.pattern_type,
+            'location': self.location,
+            'location_type': self.location_type,
+            'position': self.position,
+            'context': context,
+            'required': True,  # Assume all placeholders are required
+            'suggestions': []  # Will be populated later if needed
+        }
+
+
+def _appearance_key(placeholder: Placeholder) -> Tuple[str, Any, int]:
+    """
+    Sort key putting placeholders in appearance order: paragraphs before tables,
+    then by location, then by character position within the text.
+    
+    Args:
+        placeholder (Placeholder): Detected placeholder
+        
+    Returns:
+        Tuple[str, Any, int]: Location type, location (paragraph index or table
+            cell id string) and start position
+    """
+    location = placeholder.location
+    return (
+        placeholder.location_type,
+        location if type(location) is int else str(location),
+        placeholder.position[0]  # Character position within paragraph
+    )
+
 
 class PlaceholderDetector:
     """
@@ -44,25 +319,40 @@ class PlaceholderDetector:
         Initialize the PlaceholderDetector with patterns and keywords.
         """
         # Define placeholder patterns to search for
+        # (negated classes also exclude SEGMENT_SEPARATOR)
         self.patterns = [
             # $[__________] style - MUST come first for dollar amounts
-            (r'\$\[([^\]]*)\]', 'dollar_bracket'),
+            (r'\$\[([^\]\x00]*)\]', 'dollar_bracket'),
             # [ANY TEXT] style - case insensitive, matches any text in brackets
-            (r'\[([^\]]+)\]', 'square_bracket'),
+            (r'\[([^\]\x00]+)\]', 'square_bracket'),
             # {{placeholder}} style - common
-            (r'\{\{([^}]+)\}\}', 'double_curly'),
+            (r'\{\{([^}\x00]+)\}\}', 'double_curly'),
             # __PLACEHOLDER__ style (with actual text, not just underscores)
             (r'__([A-Za-z][A-Za-z_\s]*[A-Za-z])__', 'underscore'),
             # <PLACEHOLDER> style
             (r'<([A-Z_\s]+)>', 'angle_bracket'),
             # [INSERT PLACEHOLDER] style
-            (r'\[INSERT ([^]]+)\]', 'insert_style'),
-            # _______ (Name) style - blanks with description
-            (r'_{3,}\s*\(([^)]+)\)', 'blank_with_description'),
-            # Field: _______ style
-            (r'([A-Za-z\s]+):\s*_{3,}', 'field_with_blank'),
+            (r'\[INSERT ([^]\x00]+)\]', 'insert_style'),
+            # _______ (Name) style - blanks with description (anchored at the start
+            # of the underscore run, like the field pattern below)
+            (r'(?<!_)_{3,}\s*\(([^)\x00]+)\)', 'blank_with_description'),
+            # Field: _______ style (anchored at the start of the label's letter run:
+            # the same leftmost matches, without retrying from every letter of it)
+            (r'(?<![A-Za-z\s])([A-Za-z\s]+):\s*_{3,}', 'field_with_blank'),
         ]
         
+        # Compiled once: the document's texts are scanned with each pattern. A bad
+        # pattern fails here, once, instead of on every scan
+        try:
+            self._compiled_patterns = [
+                (re.compile(pattern, re.IGNORECASE), pattern_type,
+                 PATTERN_OPENERS[pattern_type], PATTERN_CLOSERS[pattern_type])
+                for pattern, pattern_type in self.patterns
+            ]
+        except re.error as e:
+            logger.error(f"Invalid placeholder pattern: {str(e)}")
+            raise
+        
         # Common legal placeholder keywords
         self.legal_keywords = [
             'Company Name', 'Investor Name', 'Date', 'Amount',
@@ -87,6 +377,15 @@ class PlaceholderDetector:
             'title': ['title', 'position', 'role', 'designation', 'office']
         }
         
+        # Per-name results memoized per instance: the same placeholder names recur
+        # throughout a document and across documents
+        self._clean_name_cached = lru_cache(maxsize=4096)(self._clean_placeholder_name)
+        self._normalized_key_cached = lru_cache(maxsize=4096)(self._generate_normalized_key)
+        self._type_cached = lru_cache(maxsize=4096)(self._identify_placeholder_type)
+        # Blank placeholders recur with identical surrounding text (repeated
+        # clauses, re-uploaded templates): the inference only depends on both
+        self._infer_name_cached = lru_cache(maxsize=512)(self._infer_placeholder_name)
+        
         logger.info("PlaceholderDetector initialized with %d patterns", len(self.patterns))
     
     def detect_placeholders(self, document_content: Dict[str, Any]) -> List[Dict]:
@@ -95,9 +394,8 @@ class PlaceholderDetector:
         
         This method:
         1. Searches for pattern-based placeholders
-        2. Identifies contextual placeholders
-        3. Removes duplicates while preserving order
-        4. Sorts by appearance order
+        2. Removes duplicates while preserving order
+        3. Sorts by appearance order
         
         Args:
             document_content (Dict): Parsed document content
@@ -105,157 +403,172 @@ class PlaceholderDetector:
         Returns:
             List[Dict]: List of unique placeholders with metadata
         """
-        all_placeholders = []  # Collect ALL placeholders first (no deduplication yet)
-        
-        # Search in paragraphs
-        for para_data in document_content.get('paragraphs', []):
-            text = para_data['text']
-            found = self._find_placeholders_in_text(
-                text=text,
-                location=para_data['index'],
-                location_type='paragraph'
-            )
-            
-            for placeholder in found:
-                all_placeholders.append(placeholder)
-                logger.debug(f"Found placeholder in paragraph: {placeholder['name']}")
-        
-        # Search in tables
+        # Texts to search: paragraphs, then table cells
+        segments = [
+            (para_data['text'], para_data['index'], 'paragraph')
+            for para_data in document_content.get('paragraphs', [])
+        ]
         for table_data in document_content.get('tables', []):
+            table_prefix = f"{table_data['index']}-"
             for row_idx, row in enumerate(table_data['rows']):
+                row_prefix = f"{table_prefix}{row_idx}-"
                 for col_idx, cell in enumerate(row):
-                    # Handle both dict and string cell formats
-                    cell_text = cell['text'] if isinstance(cell, dict) else str(cell)
-                    
-                    found = self._find_placeholders_in_text(
-                        text=cell_text,
-                        location=f"{table_data['index']}-{row_idx}-{col_idx}",
-                        location_type='table'
-                    )
-                    
-                    for placeholder in found:
-                        all_placeholders.append(placeholder)
-                        logger.debug(f"Found placeholder in table: {placeholder['name']}")
-        
-        # Check for contextual placeholders (blanks that should be filled)
-        # NOTE: Disabled to avoid creating non-fillable placeholders
-        # contextual = self._detect_contextual_placeholders(document_content)
-        # for placeholder in contextual:
-        #     key = placeholder['key']
-        #     if key not in seen_placeholders:
-        #         seen_placeholders[key] = placeholder
-        #         logger.debug(f"Found contextual placeholder: {placeholder['name']}")
+                    # Handle both dict and string cell formats (parsed cells are
+                    # plain dicts: an identity check, not isinstance)
+                    cell_text = cell['text'] if type(cell) is dict else str(cell)
+                    segments.append((cell_text, f"{row_prefix}{col_idx}", 'table'))
+        
+        # Collect ALL placeholders first (no deduplication yet)
+        all_placeholders = self._find_placeholders_in_segments(segments)
+        for placeholder in all_placeholders:
+            logger.debug(f"Found placeholder in {placeholder.location_type}: {placeholder.name}")
         
         # Smart deduplication based on context (not just normalized key)
         placeholders = self._smart_deduplicate(all_placeholders)
         
-        # Sort by location AND position (appearance order in document)
-        placeholders.sort(key=lambda x: (
-            x['location_type'],
-            x['location'] if isinstance(x['location'], int) else str(x['location']),
-            x['position'][0]  # Character position within paragraph
-        ))
+        # Sort by location AND position (appearance order in document); sort()
+        # computes each placeholder's key once
+        placeholders.sort(key=_appearance_key)
         
         # Filter out problematic placeholders
         filtered_placeholders = self._filter_placeholders(placeholders, document_content)
         
-        # Add sequence numbers for better tracking
+        # Occurrence ids only need to be unique within the document: a random
+        # per-document prefix plus a counter, no urandom call per placeholder
+        id_prefix = f"ph_{secrets.token_hex(3)}"
+        
+        # Only now, for the placeholders kept, identify types and extract
+        # context; convert to dicts and add sequence numbers for better tracking
+        filtered_placeholders = [
+            placeholder.to_dict(
+                f"{id_prefix}{i:04x}",
+                self._type_cached(placeholder.name),
+                self._extract_context(placeholder.text, placeholder.position)
+            )
+            for i, placeholder in enumerate(filtered_placeholders)
+        ]
         for i, placeholder in enumerate(filtered_placeholders):
             placeholder['sequence'] = i + 1
         
         logger.info(f"Detected {len(placeholders)} placeholders, {len(filtered_placeholders)} after filtering")
         return filtered_placeholders
     
-    def _find_placeholders_in_text(self, text: str, location: Any,
-                                  location_type: str) -> List[Dict]:
+    def _find_placeholders_in_segments(self, segments: List[Tuple[str, Any, str]]) -> List[Placeholder]:
         """
-        Find placeholders in a given text using various patterns.
+        Find placeholders in a document's texts using various patterns.
+        
+        The texts that could hold a placeholder are joined into one buffer and
+        each pattern scans it once; match offsets are mapped back to their text
+        through the texts' start offsets. Patterns run separately because their
+        matches may overlap each other (e.g. $[...] is also a [...] match), and
+        detection keeps every one.
+        
+        The scan stays in-process: it takes tens of milliseconds even for
+        thousands of paragraphs, less than starting worker processes and
+        pickling the texts and results back would cost.
         
         Args:
-            text (str): Text to search
-            location (Any): Location identifier
-            location_type (str): Type of location (paragraph/table)
+            segments (List[Tuple[str, Any, str]]): (text, location identifier,
+                location type) for each paragraph/table cell
             
         Returns:
-            List[Dict]: Found placeholders with metadata
+            List[Placeholder]: Found placeholders with metadata, grouped by text in segment
+                order and by pattern within a text
         """
-        found_placeholders = []
+        candidates = [
+            segment for segment in segments
+            if any(trigger in segment[0] for trigger in PLACEHOLDER_TRIGGERS)
+        ]
+        if not candidates:
+            return []
+        
+        joined = SEGMENT_SEPARATOR.join([segment[0] for segment in candidates])
+        starts = []
+        offset = 0
+        for text, _, _ in candidates:
+            starts.append(offset)
+            offset += len(text) + 1
+        
+        found_by_segment = [[] for _ in candidates]
         
         # Try each pattern
-        for pattern, pattern_type in self.patterns:
-            try:
-                matches = re.finditer(pattern, text, re.IGNORECASE)
+        for pattern, pattern_type, opener, closer in self._compiled_patterns:
+            opener_at = joined.find(opener) if opener else 0
+            if opener_at < 0:
+                continue
+            closer_at = joined.rfind(closer, opener_at)
+            if closer_at < 0:
+                continue
+            matches = pattern.finditer(joined, opener_at, closer_at + len(closer))
+            
+            for match in matches:
+                segment_idx = bisect_right(starts, match.start()) - 1
+                text, location, location_type = candidates[segment_idx]
+                text_start = starts[segment_idx]
+                span = (match.start() - text_start, match.end() - text_start)
+                # The same placeholder text recurs throughout a document: interned,
+                # every occurrence shares one string (and compares by identity)
+                full_match = sys.intern(match.group(0))
                 
-                for match in matches:
-                    full_match = match.group(0)
-                    
-                    # Extract the placeholder text based on pattern type
-                    if pattern_type == 'dollar_bracket':
-                        # For $[____] or $[text], infer from context
-                        context = self._extract_context(text, match.span(), 200)  # Expanded context for better detection
-                        captured_text = match.group(1).strip() if match.groups() else ''
-                        if captured_text and captured_text != '_' * len(captured_text):
-                            # Has actual text inside
-                            placeholder_text = captured_text
-                        else:
-                            # Blank or underscores - infer from context
-                            placeholder_text = self._infer_placeholder_name(full_match, context)
-                    elif pattern_type == 'field_with_blank':
-                        # For "Field: _____" pattern, the field name is in group 1
-                        if match.groups():
-                            placeholder_text = match.group(1).strip()
-                        else:
-                            continue
+                # Extract the placeholder text based on pattern type
+                if pattern_type == 'dollar_bracket':
+                    # For $[____] or $[text], infer from context
+                    captured_text = match.group(1).strip() if match.groups() else ''
+                    if captured_text and captured_text.strip('_'):
+                        # Has actual text inside
+                        placeholder_text = captured_text
+                    else:
+                        # Blank or underscores - infer from context (expanded
+                        # context for better detection, only sliced when needed)
+                        context = self._extract_context(text, span, 200)
+                        placeholder_text = self._infer_name_cached(full_match, context)
+                elif pattern_type == 'field_with_blank':
+                    # For "Field: _____" pattern, the field name is in group 1
+                    if match.groups():
+                        placeholder_text = match.group(1).strip()
                     else:
-                        # Most patterns capture the placeholder name in group 1
-                        if match.groups():
-                            placeholder_text = match.group(1).strip()
-                        else:
-                            # Skip patterns with no capture groups
-                            continue
-                    
-                    # Clean and normalize the placeholder name
-                    cleaned_name = self._clean_placeholder_name(placeholder_text)
-                    
-                    # Skip if empty after cleaning or too short
-                    if not cleaned_name or len(cleaned_name) < 2:
                         continue
-                    
-                    # Skip common words that aren't placeholders
-                    if cleaned_name.lower() in ['the', 'this', 'that', 'section', 'see']:
+                else:
+                    # Most patterns capture the placeholder name in group 1
+                    if match.groups():
+                        placeholder_text = match.group(1).strip()
+                    else:
+                        # Skip patterns with no capture groups
                         continue
-                    
-                    # Create placeholder data
-                    # Generate normalized key for deduplication
-                    normalized_key = self._generate_normalized_key(cleaned_name)
-                    unique_key = f"{normalized_key}_{location}"
-                    occurrence_id = f"ph_{uuid4().hex[:8]}"
-                    
-                    placeholder_data = {
-                        'id': occurrence_id,  # NEW: per-occurrence id
-                        'key': unique_key,
-                        'normalized_key': normalized_key,  # For deduplication
-                        'name': cleaned_name,
-                        'original': full_match,
-                        'type': self._identify_placeholder_type(cleaned_name),
-                        'pattern_type': pattern_type,
-                        'location': location,
-                        'location_type': location_type,
-                        'position': match.span(),
-                        'context': self._extract_context(text, match.span()),
-                        'required': True,  # Assume all placeholders are required
-                        'suggestions': []  # Will be populated later if needed
-                    }
-                    
-                    found_placeholders.append(placeholder_data)
-                    
-            except Exception as e:
-                logger.warning(f"Error with pattern {pattern}: {str(e)}")
-                continue
+                
+                # Clean and normalize the placeholder name
+                cleaned_name = self._clean_name_cached(placeholder_text)
+                
+                # Skip if empty after cleaning or too short
+                if not cleaned_name or len(cleaned_name) < 2:
+                    continue
+                
+                # Skip common words that aren't placeholders
+                if cleaned_name.lower() in ['the', 'this', 'that', 'section', 'see']:
+                    continue
+                
+                # Create placeholder data. pattern_type and location_type are
+                # literals, and name/normalized_key come from the memoized helpers,
+                # so repeated values already share one string object
+                # Generate normalized key for deduplication
+                normalized_key = self._normalized_key_cached(cleaned_name)
+                
+                placeholder_data = Placeholder(
+                    normalized_key,  # For deduplication
+                    cleaned_name,
+                    full_match,
+                    pattern_type,
+                    location,
+                    location_type,
+                    span,
+                    text
+                )
+                
+                found_by_segment[segment_idx].append(placeholder_data)
         
-        return found_placeholders
+        return [placeholder for found in found_by_segment for placeholder in found]
     
-    def _smart_deduplicate(self, all_placeholders: List[Dict]) -> List[Dict]:
+    def _smart_deduplicate(self, all_placeholders: List[Placeholder]) -> List[Placeholder]:
         """
         Smart deduplication that uses CONTEXT to differentiate identical patterns.
         
@@ -275,14 +588,13 @@ class PlaceholderDetector:
             return []
         
         # Group by context-aware signature + location to ensure different locations stay separate
-        groups = {}
+        groups = defaultdict(list)
         
         for p in all_placeholders:
-            name_lower = p['name'].lower().strip()
-            context_lower = p.get('context', '').lower()
-            original = p['original']
-            location = p['location']
-            location_type = p['location_type']
+            name_lower = p.name.lower().strip()
+            original = p.original
+            location = p.location
+            location_type = p.location_type
             
             # Special handling for identical patterns (like $[___] or [___])
             # CRITICAL: Include location in signature to prevent merging across different locations
@@ -291,6 +603,8 @@ class PlaceholderDetector:
                 is_blank_dollar = original.startswith('$[') and ('_' in original or len(original) > 8)
                 if is_blank_dollar:
                     # Use CONTEXT to differentiate, but ALWAYS include location
+                    # (extracted here: other placeholders' context waits for to_dict)
+                    context_lower = self._extract_context(p.text, p.position).lower()
                     if 'purchase amount' in context_lower or 'payment by' in context_lower or 'exchange for' in context_lower:
                         signature = f'purchase_amount_{location_type}_{location}'
                     elif 'post-money valuation cap' in context_lower or 'valuation cap' in context_lower:
@@ -305,11 +619,9 @@ class PlaceholderDetector:
                     signature = f"{name_lower}_{location_type}_{location}"
             else:
                 # For named placeholders, include location to prevent cross-location merging
-                normalized_key = p.get('normalized_key', name_lower)
+                normalized_key = p.normalized_key
                 signature = f"{normalized_key}_{location_type}_{location}"
             
-            if signature not in groups:
-                groups[signature] = []
             groups[signature].append(p)
         
         # For each group, handle duplicates
@@ -321,175 +633,31 @@ class PlaceholderDetector:
             else:
                 # Multiple occurrences with same signature - these are true duplicates
                 # Sort by position within the same location and keep only the first
-                group.sort(key=lambda x: x['position'][0])
+                group.sort(key=lambda x: x.position[0])
                 
                 # Only deduplicate if they're in the EXACT same location and position is very close
                 # (within 10 characters suggests it's the same placeholder detected twice)
+                # The group is sorted by start, so the closest kept occurrence is
+                # always the last one kept: one comparison per placeholder
                 filtered_group = []
-                seen_positions = set()
+                last_kept_start = None
                 
                 for p in group:
-                    pos_key = (p['position'][0], p['position'][1])
+                    start = p.position[0]
                     # Only consider it a duplicate if position is very close (within 10 chars)
-                    is_duplicate = False
-                    for seen_pos in seen_positions:
-                        if abs(pos_key[0] - seen_pos[0]) < 10:
-                            is_duplicate = True
-                            break
-                    
-                    if not is_duplicate:
+                    if last_kept_start is None or start - last_kept_start >= 10:
                         filtered_group.append(p)
-                        seen_positions.add(pos_key)
+                        last_kept_start = start
                 
                 # Keep all non-duplicate occurrences
                 unique.extend(filtered_group)
                 
                 if len(group) > len(filtered_group):
-                    logger.info(f"Deduplicated {len(group) - len(filtered_group)} duplicate occurrences of '{group[0]['name']}' (signature: {signature})")
+                    logger.info(f"Deduplicated {len(group) - len(filtered_group)} duplicate occurrences of '{group[0].name}' (signature: {signature})")
         
         logger.info(f"Smart deduplication: {len(all_placeholders)} total → {len(unique)} unique")
         return unique
     
-    def _detect_contextual_placeholders(self, content: Dict[str, Any]) -> List[Dict]:
-        """
-        Detect contextual placeholders that might not follow standard patterns.
-        
-        This includes:
-        - Lines with blanks to fill
-        - Form-style fields
-        - Implicit placeholders
-        - Label-only paragraphs followed by blank paragraphs
-        
-        Args:
-            content (Dict): Document content
-            
-        Returns:
-            List[Dict]: Contextual placeholders found
-        """
-        contextual_placeholders = []
-        
-        # Patterns for contextual detection
-        blank_patterns = [
-            # Field Name: ________
-            (r'([A-Za-z\s]+):\s*_{3,}', 'field_blank'),
-            # Field Name ________
-            (r'([A-Za-z\s]+)\s+_{3,}', 'field_space_blank'),
-            # ________ (Field Name)
-            (r'_{3,}\s*\(([^)]+)\)', 'blank_description'),
-            # By: ________ Name: ________
-            (r'([A-Za-z]+):\s*_{3,}', 'label_blank'),
-        ]
-        
-        # Search paragraphs for contextual patterns
-        for para_data in content.get('paragraphs', []):
-            text = para_data['text']
-            
-            for pattern, pattern_name in blank_patterns:
-                matches = re.finditer(pattern, text, re.IGNORECASE)
-                
-                for match in matches:
-                    # Extract field name
-                    if pattern_name in ['blank_description']:
-                        field_name = match.group(1).strip()
-                    else:
-                        field_name = match.group(1).strip()
-                    
-                    # Clean the field name
-                    field_name = self._clean_placeholder_name(field_name)
-                    
-                    if not field_name or len(field_name) < 2:
-                        continue
-                    
-                    # Create placeholder data
-                    placeholder_data = {
-                        'key': self._generate_placeholder_key(field_name),
-                        'name': field_name,
-                        'original': match.group(0),
-                        'type': self._identify_placeholder_type(field_name),
-                        'pattern_type': f'contextual_{pattern_name}',
-                        'location': para_data['index'],
-                        'location_type': 'paragraph',
-                        'position': match.span(),
-                        'context': self._extract_context(text, match.span()),
-                        'required': True,
-                        'suggestions': []
-                    }
-                    
-                    contextual_placeholders.append(placeholder_data)
-        
-        # Detect label-only paragraphs followed by blank paragraphs (form-style fields)
-        # We need to check the RAW paragraphs, not the filtered ones
-        paragraphs = content.get('paragraphs', [])
-        
-        # Create a map of original indices for gap checking
-        para_map = {para_data['index']: para_data for para_data in paragraphs}
-        
-        for i, para_data in enumerate(paragraphs):
-            text = para_data['text'].strip()
-            current_idx = para_data['index']
-            
-            # Check if this is a label-only paragraph (ends with colon, no other content)
-            # Pattern: "Field Name:" or "Label:" 
-            if re.match(r'^[A-Za-z][A-Za-z\s]+:\s*$', text):
-                # Check if the next paragraph is blank or has minimal content
-                # Need to check both the list index AND the document index
-                is_last = (i + 1 >= len(paragraphs))
-                should_consider = False
-                
-                if is_last:
-                    # Last paragraph is always a form field if it's a label
-                    should_consider = True
-                else:
-                    next_para = paragraphs[i + 1]
-                    next_idx = next_para['index']
-                    next_text = next_para['text'].strip()
-                    
-                    # Check if there's a gap (empty paragraph) or if next is actually blank
-                    # Gap indicates empty paragraph in raw document
-                    has_gap = (next_idx - current_idx) > 1
-                    
-                    # If next paragraph is blank or we have a gap, this is a form field
-                    should_consider = (has_gap or not next_text or len(next_text) < 2)
-                
-                if should_consider:
-                    # Skip labels that are already detected as part of previous patterns
-                    # (like "By:", "Name:", etc. that might already have placeholders nearby)
-                    field_name = re.sub(r':\s*$', '', text).strip()
-                    
-                    # Skip if already detected or if it's a generic label
-                    field_name_clean = self._clean_placeholder_name(field_name)
-                    
-                    # Skip label-only signature fields (Address:, Email:) as they can't be filled
-                    # These don't have actual placeholders to replace in the document
-                    is_signature_label = field_name_clean.lower() in ['address', 'email']
-                    
-                    if is_signature_label:
-                        # Skip these - they're just labels without fillable placeholders
-                        continue
-                    
-                    # Use location-based key for contextual placeholders
-                    key = self._generate_placeholder_key(field_name_clean, current_idx)
-                    
-                    if len(field_name_clean) >= 2:
-                        # Create placeholder for this blank field
-                        placeholder_data = {
-                            'key': key,
-                            'name': field_name_clean,
-                            'original': f"{text} ______",  # Show as "Label: ______"
-                            'type': self._identify_placeholder_type(field_name_clean),
-                            'pattern_type': 'contextual_form_field',
-                            'location': para_data['index'],
-                            'location_type': 'paragraph',
-                            'position': (0, len(text)),
-                            'context': f"{text} [...]",
-                            'required': True,
-                            'suggestions': []
-                        }
-                        
-                        contextual_placeholders.append(placeholder_data)
-        
-        return contextual_placeholders
-    
     def _clean_placeholder_name(self, name: str) -> str:
         """
         Clean and normalize placeholder name.
@@ -508,30 +676,13 @@ class PlaceholderDetector:
             name = name.title()
         
         # Remove common prefixes that don't add value
-        prefixes_to_remove = ['Insert', 'Enter', 'Add', 'Input', 'Type', 'Provide', 'Fill']
-        for prefix in prefixes_to_remove:
-            if name.startswith(prefix + ' '):
-                name = name[len(prefix)+1:]
-            elif name.startswith(prefix.upper() + ' '):
-                name = name[len(prefix)+1:]
-        
-        # Handle special cases - only apply if exact word match
-        replacements = {
-            'Co.': 'Company',
-            'Corp.': 'Corporation',
-            'Inc.': 'Incorporated',
-            'Addr': 'Address',
-            'Amt': 'Amount',
-            'Pct': 'Percentage',
-            'No.': 'Number',
-            'Tel': 'Telephone',
-            'Qty': 'Quantity'
-        }
+        name = name[NAME_PREFIX_RE.match(name).end():]
         
-        for old, new in replacements.items():
-            # Only replace if it's a full word match
-            pattern = r'\b' + re.escape(old) + r'\b'
-            name = re.sub(pattern, new, name)
+        # Handle special cases - only apply if exact word match. Expansions are
+        # applied one after another, as each can change the next one's word boundaries
+        if NAME_ABBREVIATION_RE.search(name):
+            for pattern, new in NAME_ABBREVIATION_PATTERNS:
+                name = pattern.sub(new, name)
         
         return name.strip()
     
@@ -550,66 +701,13 @@ class PlaceholderDetector:
         key = name.lower().strip()
         
         # Replace spaces and special characters
-        key = re.sub(r'[^a-z0-9]+', '_', key)
+        key = NONALNUM_RE.sub('_', key)
         
         # Remove leading/trailing underscores
         key = key.strip('_')
         
         # Standardize common variations - keep each unique field separate
-        # CRITICAL: purchase_amount and valuation_cap are SEPARATE fields!
-        key_mappings = {
-            'company_name': 'company_name',
-            'company': 'company_name',
-            'investor_name': 'investor_name',
-            'investor': 'investor_name',
-            'purchase_amount': 'purchase_amount',
-            'date_of_safe': 'date_of_safe',
-            'safe_date': 'date_of_safe',
-            'state_of_incorporation': 'state_of_incorporation',
-            # Valuation Cap variations - all map to same key
-            'valuation_cap': 'valuation_cap',
-            'valuation_cap_amount': 'valuation_cap',
-            'post_money_valuation_cap': 'valuation_cap',
-            'postmoney_valuation_cap': 'valuation_cap',
-            'post_money_valuation_cap': 'valuation_cap',
-            'governing_law_jurisdiction': 'governing_law_jurisdiction',
-            'governing_law': 'governing_law_jurisdiction',
-            # Keep 'name' and 'title' as separate fields (signature fields)
-            'name': 'signatory_name',
-            'title': 'signatory_title',
-        }
-        
-        return key_mappings.get(key, key)
-    
-    def _generate_placeholder_key(self, name: str, location: Optional[Any] = None) -> str:
-        """
-        Generate a unique key for the placeholder (deprecated - use normalized_key).
-        
-        Args:
-            name (str): Placeholder name
-            location (Optional[Any]): Location context to differentiate duplicates
-            
-        Returns:
-            str: Unique key
-        """
-        # Create a clean key from the name
-        key = name.lower()
-        
-        # Replace spaces and special characters
-        key = re.sub(r'[^a-z0-9]+', '_', key)
-        
-        # Remove leading/trailing underscores
-        key = key.strip('_')
-        
-        # Ensure it's not empty
-        if not key:
-            key = 'placeholder'
-        
-        # Add location suffix for duplicate differentiation
-        if location is not None:
-            key = f"{key}_{location}"
-        
-        return key
+        return NORMALIZED_KEY_MAPPINGS.get(key, key)
     
     def _identify_placeholder_type(self, name: str) -> str:
         """
@@ -626,26 +724,11 @@ class PlaceholderDetector:
         # CRITICAL: Check special cases FIRST (before type_indicators)
         # to avoid false matches (e.g., "State of Incorporation" should be 'address', not 'company')
         
-        # Special cases for compound phrases
-        # IMPORTANT: Check address fields FIRST to override 'party' matching in person type
-        if 'address' in name_lower:
-            return 'address'
-        elif 'state of incorporation' in name_lower:
-            return 'address'
-        elif 'governing law' in name_lower or 'governing law jurisdiction' in name_lower:
-            return 'address'
-        elif 'valuation cap' in name_lower:
-            return 'amount'
-        elif 'discount rate' in name_lower:
-            return 'percentage'
-        elif 'purchase amount' in name_lower:
-            return 'amount'
-        elif 'date of safe' in name_lower or 'safe date' in name_lower:
-            return 'date'
-        elif 'investor name' in name_lower:
-            return 'person'
-        elif 'company name' in name_lower:
-            return 'company'
+        # Special cases for compound phrases, found in one scan: the phrase listed
+        # first wins, wherever it appears in the name
+        special_ranks = [match.lastindex for match in SPECIAL_NAME_TYPE_RE.finditer(name_lower)]
+        if special_ranks:
+            return SPECIAL_NAME_TYPES[min(special_ranks) - 1][1]
         # Special handling for "Term Months", "Number of Months" etc. - these are numbers, not dates
         elif ('term' in name_lower and 'month' in name_lower) or ('number of month' in name_lower) or ('month' in name_lower and any(word in name_lower for word in ['term', 'number', 'count', 'quantity', 'duration', 'period'])):
             return 'number'
@@ -680,18 +763,13 @@ class PlaceholderDetector:
         context_start = max(0, start - context_size)
         context_end = min(len(text), end + context_size)
         
-        # Extract context
-        context = text[context_start:context_end]
-        
-        # Add ellipsis if truncated
-        if context_start > 0:
-            context = '...' + context
-        if context_end < len(text):
-            context = context + '...'
-        
-        return context
+        # Extract context, with an ellipsis on each truncated side (built in
+        # one string)
+        prefix = '...' if context_start > 0 else ''
+        suffix = '...' if context_end < len(text) else ''
+        return f"{prefix}{text[context_start:context_end]}{suffix}"
     
-    def _filter_placeholders(self, placeholders: List[Dict], document_content: Dict) -> List[Dict]:
+    def _filter_placeholders(self, placeholders: List[Placeholder], document_content: Dict) -> List[Placeholder]:
         """
         Filter out problematic placeholders that shouldn't be prompted.
         
@@ -706,11 +784,11 @@ class PlaceholderDetector:
         
         # Filter out problematic placeholders
         for placeholder in placeholders:
-            name = placeholder['name']
-            location = placeholder['location']
+            name = placeholder.name
+            location = placeholder.location
             
             # Skip empty/blank placeholders (underscores only)
-            if not name or name == '_' * len(name):
+            if not name.strip('_'):
                 logger.debug(f"Skipping blank placeholder at location {location}")
                 continue
             
@@ -734,72 +812,68 @@ class PlaceholderDetector:
         Returns:
             str: Inferred placeholder name
         """
-        # CRITICAL: Check context for specific keywords FIRST (expanded context window)
-        context_lower = context.lower()
-        
-        # Check for Valuation Cap indicators FIRST (more specific)
-        if 'post-money valuation cap' in context_lower or 'post money valuation cap' in context_lower or 'valuation cap' in context_lower:
-            return 'Post-Money Valuation Cap'
-        
-        if 'post money' in context_lower:
-            return 'Post-Money Valuation Cap'
-        
-        # Check for Purchase Amount indicators
-        if 'purchase amount' in context_lower or 'payment by' in context_lower or 'exchange for' in context_lower:
-            return 'Purchase Amount'
-        
-        # Look for common patterns before the placeholder
-        patterns = [
-            r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+is\s*$',  # "Purchase Amount is"
-            r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s*[:\-]\s*$',  # "Company Name: _____"
-            r'[Bb]y\s+([A-Za-z\s]+?)[:]\s*$',  # "by Investor Name:" or "By: _____"
-            r'^([A-Za-z\s]+):\s*$',  # "Name:" at start
-            r'([A-Z][A-Za-z\s]{3,30})\s+(?:of|for)\s*$',  # "State of Incorporation"
-            r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s*\($',  # "Name ("
-        ]
-        
-        # Try to extract field name from context before placeholder
-        before_text = context.split(placeholder_match)[0] if placeholder_match in context else context
+        # CRITICAL: Check context for specific keywords FIRST (expanded context
+        # window), all in one scan: the first-listed name found wins
+        keyword_ranks = [match.lastindex for match in CONTEXT_NAME_KEYWORD_RE.finditer(context.lower())]
+        if keyword_ranks:
+            return CONTEXT_NAME_KEYWORDS[min(keyword_ranks) - 1][1]
+        
+        # Try to extract field name from context before placeholder (one
+        # partition at its first occurrence; no need to split the whole context)
+        before_part, separator, after_part = context.partition(placeholder_match)
+        before_text = before_part if separator else context
         before_text = before_text[-100:].strip()  # Increased to 100 chars for better context
         
-        # Try patterns in order
-        for pattern in patterns:
-            match = re.search(pattern, before_text, re.IGNORECASE)
+        # Try patterns in order (not as one alternation: an earlier pattern wins
+        # wherever the later ones match, and a rejected name falls through to
+        # the next pattern)
+        last_at = len(before_text) - 1
+        for pattern, last_char in INFER_NAME_PATTERNS:
+            if last_at < 0 or not last_char.match(before_text, last_at):
+                continue
+            match = pattern.search(before_text)
             if match:
                 inferred = match.group(1).strip()
-                # Clean up common prefixes
-                inferred = re.sub(r'^(the|a|an)\s+', '', inferred, flags=re.IGNORECASE)
+                # Clean up common prefixes (the name is stripped: an article is
+                # its first word, followed by the rest)
+                words = inferred.split(None, 1)
+                if len(words) == 2 and words[0].lower() in LEADING_ARTICLES:
+                    inferred = words[1]
                 # Capitalize properly
-                inferred = ' '.join(word.capitalize() for word in inferred.split())
+                inferred = capwords(inferred)
                 # Validate it's not too short or common
                 if len(inferred) >= 3 and inferred.lower() not in ['the', 'and', 'for', 'with', 'this', 'that']:
                     return inferred
         
-        # Check text after placeholder for hints
-        after_text = context.split(placeholder_match)[1] if placeholder_match in context and len(context.split(placeholder_match)) > 1 else ''
+        # Check text after placeholder for hints (up to its next occurrence)
+        after_text = after_part.partition(placeholder_match)[0]
         after_text = after_text[:50].strip()
         
         # Look for parenthetical hints: "_____ (explanation)"
-        paren_match = re.search(r'^\s*\(([^)]+)\)', after_text)
+        paren_match = PAREN_HINT_RE.search(after_text)
         if paren_match:
             hint = paren_match.group(1).strip()
             if 3 <= len(hint) <= 40:
                 # Clean up quotes and other marks
-                hint = re.sub(r'^["\']+|["\']+$', '', hint)
-                return ' '.join(word.capitalize() for word in hint.split())
+                hint = SURROUNDING_QUOTES_RE.sub('', hint)
+                return capwords(hint)
         
         # If starts with $, it's likely a monetary amount
         if placeholder_match.startswith('$'):
             return 'Purchase Amount'
-        elif 'company' in before_text.lower()[-40:]:
+        # Lowercased once; the last 40 and last 20 characters are checked
+        before_lower = before_text.lower()
+        tail40 = before_lower[-40:]
+        tail20 = before_lower[-20:]
+        if 'company' in tail40:
             return 'Company Information'
-        elif 'investor' in before_text.lower()[-40:]:
+        elif 'investor' in tail40:
             return 'Investor Information'
-        elif 'name' in before_text.lower()[-20:]:
+        elif 'name' in tail20:
             return 'Name'
-        elif 'title' in before_text.lower()[-20:]:
+        elif 'title' in tail20:
             return 'Title/Position'
-        elif 'date' in before_text.lower()[-20:]:
+        elif 'date' in tail20:
             return 'Date'
         
         # Default names based on length and type
@@ -831,26 +905,12 @@ class PlaceholderDetector:
         }
         
         for placeholder in placeholders:
-            placeholder_type = placeholder.get('type', 'text')
-            name_lower = placeholder.get('name', '').lower()
-            
-            # Categorize based on type and name
-            if placeholder_type == 'company':
-                groups['company_info'].append(placeholder)
-            elif placeholder_type == 'person':
-                groups['personal_info'].append(placeholder)
-            elif placeholder_type == 'date':
-                groups['dates'].append(placeholder)
-            elif placeholder_type in ['amount', 'percentage', 'number']:
-                groups['financial'].append(placeholder)
-            elif placeholder_type == 'contact':
-                groups['contact'].append(placeholder)
-            elif placeholder_type == 'address':
-                groups['addresses'].append(placeholder)
-            elif any(term in name_lower for term in ['governing', 'jurisdiction', 'law', 'notice']):
-                groups['legal_terms'].append(placeholder)
-            else:
-                groups['other'].append(placeholder)
+            # Categorize based on type, then (for other types) on name
+            group = PLACEHOLDER_TYPE_GROUPS.get(placeholder.get('type', 'text'))
+            if group is None:
+                name_lower = placeholder.get('name', '').lower()
+                group = 'legal_terms' if any(term in name_lower for term in LEGAL_TERM_WORDS) else 'other'
+            groups[group].append(placeholder)
         
         # Remove empty groups
         groups = {k: v for k, v in groups.items() if v}
@@ -883,13 +943,10 @@ class PlaceholderDetector:
                 suggestions.append(today.strftime('%m/%d/%Y'))
             elif 'expiration' in name_lower or 'end' in name_lower or 'termination' in name_lower:
                 # Suggest dates in the future
-                future_dates = [
-                    today + timedelta(days=30),   # 30 days
-                    today + timedelta(days=90),   # 90 days
-                    today + timedelta(days=365),  # 1 year
+                suggestions = [
+                    (today + timedelta(days=days)).strftime('%m/%d/%Y')
+                    for days in FUTURE_DATE_OFFSETS_DAYS
                 ]
-                for date in future_dates:
-                    suggestions.append(date.strftime('%m/%d/%Y'))
         
         # Company suggestions from context
         elif placeholder_type == 'company':
@@ -897,47 +954,34 @@ class PlaceholderDetector:
                 suggestions.extend(context['recent_companies'][:3])
             else:
                 # Common company suffixes
-                suggestions = ['[Company Name], Inc.', '[Company Name] LLC', '[Company Name] Corporation']
-        
-        # Percentage suggestions
-        elif placeholder_type == 'percentage':
-            if 'discount' in name_lower:
-                suggestions = ['20%', '15%', '10%', '25%']
-            elif 'interest' in name_lower:
-                suggestions = ['5%', '7%', '10%', '12%']
-            elif 'commission' in name_lower:
-                suggestions = ['5%', '10%', '15%', '20%']
-            else:
-                suggestions = ['10%', '25%', '50%']
-        
-        # Amount suggestions
-        elif placeholder_type == 'amount':
-            if 'valuation' in name_lower:
-                suggestions = ['$5,000,000', '$10,000,000', '$25,000,000']
-            elif 'investment' in name_lower or 'purchase' in name_lower:
-                suggestions = ['$100,000', '$250,000', '$500,000', '$1,000,000']
-            elif 'fee' in name_lower:
-                suggestions = ['$1,000', '$5,000', '$10,000']
-            else:
-                suggestions = ['$10,000', '$50,000', '$100,000']
+                suggestions = list(COMPANY_NAME_SUGGESTIONS)
+        
+        # Percentage and amount suggestions: the first entry with a keyword in
+        # the name, else the type's default
+        elif placeholder_type in KEYWORD_SUGGESTIONS:
+            keyword_suggestions, default_suggestions = KEYWORD_SUGGESTIONS[placeholder_type]
+            suggestions = list(next(
+                (values for keywords, values in keyword_suggestions
+                 if any(keyword in name_lower for keyword in keywords)),
+                default_suggestions
+            ))
         
         # State suggestions (for incorporation)
         elif placeholder_type == 'address' and 'state' in name_lower:
             if 'incorporation' in name_lower:
                 # Common states for incorporation
-                suggestions = ['Delaware', 'Nevada', 'Wyoming', 'California', 'New York']
+                suggestions = list(INCORPORATION_STATE_SUGGESTIONS)
             else:
                 # General state suggestions
-                suggestions = ['California', 'New York', 'Texas', 'Florida', 'Illinois']
+                suggestions = list(STATE_SUGGESTIONS)
         
         # Title suggestions
         elif 'title' in name_lower or 'position' in name_lower:
-            suggestions = ['Chief Executive Officer', 'President', 'Chief Financial Officer',
-                          'Vice President', 'Secretary', 'Director']
+            suggestions = list(TITLE_SUGGESTIONS)
         
         # Number of shares suggestions
         elif 'shares' in name_lower:
-            suggestions = ['1,000,000', '10,000,000', '100,000', '500,000']
+            suggestions = list(SHARE_COUNT_SUGGESTIONS)
         
         return suggestions
     
@@ -963,7 +1007,7 @@ class PlaceholderDetector:
         # Check key format
         if 'key' in placeholder:
             key = placeholder['key']
-            if not re.match(r'^[a-z0-9_]+$', key):
+            if not PLACEHOLDER_KEY_RE.match(key):
                 warnings.append(f"Key contains invalid characters: {key}")
         
         # Check name
@@ -976,9 +1020,7 @@ class PlaceholderDetector:
         
         # Check type
         if 'type' in placeholder:
-            valid_types = ['company', 'person', 'date', 'amount', 'percentage',
-                          'address', 'contact', 'number', 'signature', 'text']
-            if placeholder['type'] not in valid_types:
+            if placeholder['type'] not in VALID_PLACEHOLDER_TYPES:
                 warnings.append(f"Unknown type: {placeholder['type']}")
         
         return {
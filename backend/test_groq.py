@@ -7,13 +7,20 @@ This script tests if Groq API is properly configured and responding.
 import os
 import sys
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent))
+# Question-generation request parts shared by every field
+QUESTION_SYSTEM_MESSAGE = {"role": "system", "content": "You are a helpful legal document assistant. Generate conversational questions for document fields."}
+QUESTION_PROMPT_TEMPLATE = """Generate a friendly, professional question to ask for filling the field "{field_name}" which is of type "{field_type}".
 
-# Load environment variables
-load_dotenv()
+Guidelines:
+- Be concise (one sentence)
+- Be friendly and professional
+- Provide format examples if needed
+- Don't be overly verbose
+
+Return ONLY the question, no prefixes or extra text."""
 
 def test_groq_import():
     """Test if Groq package is installed"""
@@ -91,6 +98,23 @@ def test_groq_api_call(client):
             print("   → Model name might be incorrect")
         return False
 
+def _ask_groq(client, field_name, field_type):
+    """Ask Groq for the question to fill one field"""
+    prompt = QUESTION_PROMPT_TEMPLATE.format(field_name=field_name, field_type=field_type)
+    
+    response = client.chat.completions.create(
+        model="llama-3.3-70b-versatile",
+        messages=[
+            QUESTION_SYSTEM_MESSAGE,
+            {"role": "user", "content": prompt}
+        ],
+        temperature=0.3,
+        max_tokens=100,
+        top_p=0.9
+    )
+    
+    return response.choices[0].message.content.strip()
+
 def test_question_generation(client):
     """Test question generation for different field types"""
     print("\n[TEST] Testing question generation for different field types...")
@@ -102,31 +126,17 @@ def test_question_generation(client):
         ("Valuation Cap", "amount"),
     ]
     
+    # The requests are independent: send them all at once, then report in order
+    with ThreadPoolExecutor(max_workers=len(test_cases)) as executor:
+        futures = [
+            (field_name, executor.submit(_ask_groq, client, field_name, field_type))
+            for field_name, field_type in test_cases
+        ]
+    
     results = []
-    for field_name, field_type in test_cases:
+    for field_name, future in futures:
         try:
-            prompt = f"""Generate a friendly, professional question to ask for filling the field "{field_name}" which is of type "{field_type}".
-
-Guidelines:
-- Be concise (one sentence)
-- Be friendly and professional
-- Provide format examples if needed
-- Don't be overly verbose
-
-Return ONLY the question, no prefixes or extra text."""
-
-            response = client.chat.completions.create(
-                model="llama-3.3-70b-versatile",
-                messages=[
-                    {"role": "system", "content": "You are a helpful legal document assistant. Generate conversational questions for document fields."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                max_tokens=100,
-                top_p=0.9
-            )
-            
-            answer = response.choices[0].message.content.strip()
+            answer = future.result()
             results.append((field_name, True, answer))
             print(f"   [OK] {field_name}: '{answer}'")
             
@@ -138,6 +148,13 @@ Return ONLY the question, no prefixes or extra text."""
 
 def main():
     """Run all tests"""
+    # Add parent directory to path (only when run as a script, so importing
+    # this module has no side effects)
+    sys.path.insert(0, str(Path(__file__).parent))
+    
+    # Load environment variables
+    load_dotenv()
+    
     print("=" * 60)
     print("Groq API Test Script")
     print("=" * 60)